@@ -6,12 +6,24 @@ DOCX文档提取器打包脚本
 使用PyInstaller将Python项目打包为独立可执行文件
 """
 
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# 设置环境变量 BUILD_CLEAN=1 时进行完整的冷构建（清除PyInstaller缓存和build目录），
+# 默认保留build目录中的分析缓存以加快增量构建
+BUILD_CLEAN = os.environ.get("BUILD_CLEAN") == "1"
+
+# 清理Python缓存时不进入的目录（虚拟环境、依赖、版本库和输出目录）
+PRUNE_DIRS = {".git", "venv", ".venv", "node_modules", "dist"}
+
+# 记录上次成功安装依赖时 requirements.txt、Python版本与Python环境（sys.prefix）的哈希，未变化时跳过pip安装
+REQUIREMENTS_STAMP = Path(".build_cache/requirements.sha256")
+
 
 def print_banner(message: str) -> None:
     """打印横幅信息
@@ -30,18 +42,9 @@ def check_python() -> bool:
     Returns:
         True如果Python可用，否则False
     """
-    try:
-        result = subprocess.run([sys.executable, "--version"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"Python版本: {result.stdout.strip()}")
-            return True
-        else:
-            print("错误: Python不可用")
-            return False
-    except Exception as e:
-        print(f"错误: 检查Python版本失败: {e}")
-        return False
+    # 脚本本身就运行在该解释器上，直接读取版本信息即可
+    print(f"Python版本: Python {sys.version.split()[0]}")
+    return True
 
 
 def check_project_structure() -> bool:
@@ -63,15 +66,39 @@ def check_project_structure() -> bool:
     return True
 
 
+def remove_python_caches() -> None:
+    """递归清理当前目录下的Python缓存（__pycache__目录和.pyc文件），跳过PRUNE_DIRS中的目录"""
+    dirs_to_remove = []
+    files_to_remove = []
+    for dir_path, dir_names, file_names in os.walk("."):
+        if "__pycache__" in dir_names:
+            dirs_to_remove.append(os.path.join(dir_path, "__pycache__"))
+        dir_names[:] = [d for d in dir_names if d != "__pycache__" and d not in PRUNE_DIRS]
+        
+        files_to_remove.extend(Path(dir_path, f) for f in file_names if f.endswith(".pyc"))
+    
+    # 删除操作相互独立，并行执行以降低逐个删除的系统调用延迟（Windows杀毒软件扫描时尤为明显）
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        executor.map(lambda path: shutil.rmtree(path, ignore_errors=True), dirs_to_remove)
+        # 逐个读取结果，使删除.pyc文件失败（如文件被占用时的PermissionError）与逐个删除时一样抛出
+        for _ in executor.map(lambda path: path.unlink(missing_ok=True), files_to_remove):
+            pass
+
+
 def clean_build_artifacts() -> None:
     """清理之前的构建产物"""
     print("清理之前的构建产物...")
     
-    # 清理目录
-    for dir_name in ["build", "__pycache__"]:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name, ignore_errors=True)
-            print(f"已删除: {dir_name}")
+    # 清理目录（build目录仅在冷构建时清理）
+    dir_names = ["build", "__pycache__"] if BUILD_CLEAN else ["__pycache__"]
+    for dir_name in dir_names:
+        try:
+            shutil.rmtree(dir_name)
+        except FileNotFoundError:
+            continue
+        except OSError:
+            pass
+        print(f"已删除: {dir_name}")
     
     # 清理文件
     for file_pattern in ["*.spec"]:
@@ -81,16 +108,15 @@ def clean_build_artifacts() -> None:
     
     # 清理dist中的exe文件
     exe_file = Path("dist/docx_extractor.exe")
-    if exe_file.exists():
+    try:
         exe_file.unlink()
         print(f"已删除: {exe_file}")
+    except FileNotFoundError:
+        pass
     
-    # 递归清理Python缓存
-    for cache_dir in Path(".").rglob("__pycache__"):
-        shutil.rmtree(cache_dir, ignore_errors=True)
-    
-    for pyc_file in Path(".").rglob("*.pyc"):
-        pyc_file.unlink(missing_ok=True)
+    # 递归清理Python缓存（构建结束时final_cleanup会再清理一次，仅冷构建时预先清理）
+    if BUILD_CLEAN:
+        remove_python_caches()
 
 
 def install_requirements() -> bool:
@@ -100,16 +126,29 @@ def install_requirements() -> bool:
         True如果安装成功，否则False
     """
     requirements_file = Path("requirements.txt")
-    if not requirements_file.exists():
+    try:
+        requirements_data = requirements_file.read_bytes()
+    except FileNotFoundError:
         print("跳过依赖安装: requirements.txt不存在")
         return True
     
+    # 切换到另一个虚拟环境（Python版本相同）时sys.prefix不同，需要重新安装依赖
+    requirements_hash = hashlib.sha256(requirements_data + sys.version.encode() + sys.prefix.encode()).hexdigest()
+    try:
+        if REQUIREMENTS_STAMP.read_text(encoding="utf-8").strip() == requirements_hash:
+            print("依赖未变化，跳过安装")
+            return True
+    except OSError:
+        pass
+    
     print("安装项目依赖...")
     try:
         result = subprocess.run([
             sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
         ], check=True)
         print("依赖安装成功")
+        REQUIREMENTS_STAMP.parent.mkdir(parents=True, exist_ok=True)
+        REQUIREMENTS_STAMP.write_text(requirements_hash, encoding="utf-8")
         return True
     except subprocess.CalledProcessError as e:
         print(f"错误: 依赖安装失败: {e}")
@@ -130,7 +169,7 @@ def build_executable() -> bool:
         sys.executable, "-m", "PyInstaller",
         "--onefile",                    # 打包为单个文件
         "--name", "docx_extractor",     # 可执行文件名
-        "--clean",                      # 清理缓存
+        "--noconfirm",                  # 覆盖已有输出时不询问
         "--windowed",                   # Windows下隐藏控制台窗口（无黑色终端样式）
         "--add-data", "src/gui.py;.",   # 添加GUI模块  
         "--add-data", "src/config.py;.", # 添加配置模块
@@ -141,6 +180,10 @@ def build_executable() -> bool:
         "src/main.py"                   # 主入口文件
     ]
     
+    # 冷构建时清理PyInstaller缓存
+    if BUILD_CLEAN:
+        cmd.insert(cmd.index("--noconfirm") + 1, "--clean")
+    
     # 如果图标文件存在，添加到exe图标
     if icon_path.exists():
         cmd.insert(cmd.index("--windowed") + 1, "--icon")
@@ -162,24 +205,25 @@ def check_executable() -> bool:
         True如果可执行文件存在，否则False
     """
     exe_file = Path("dist/docx_extractor.exe")
-    if exe_file.exists():
+    try:
         file_size = exe_file.stat().st_size
-        print(f"可执行文件已生成: {exe_file}")
-        print(f"文件大小: {file_size:,} 字节")
-        print()
-        print("使用方法: docx_extractor.exe [docx_file_path]")
-        return True
-    else:
+    except FileNotFoundError:
         print("错误: 可执行文件未在dist目录中找到")
         return False
+    
+    print(f"可执行文件已生成: {exe_file}")
+    print(f"文件大小: {file_size:,} 字节")
+    print()
+    print("使用方法: docx_extractor.exe [docx_file_path]")
+    return True
 
 
 def final_cleanup() -> None:
-    """最终清理，只保留exe文件"""
+    """最终清理，只保留exe文件（增量构建时保留build目录缓存）"""
     print("清理构建产物...")
     
     # 清理build目录
-    if Path("build").exists():
+    if BUILD_CLEAN:
         shutil.rmtree("build", ignore_errors=True)
     
     # 清理spec文件
@@ -187,11 +231,7 @@ def final_cleanup() -> None:
         spec_file.unlink(missing_ok=True)
     
     # 清理Python缓存
-    for cache_dir in Path(".").rglob("__pycache__"):
-        shutil.rmtree(cache_dir, ignore_errors=True)
-    
-    for pyc_file in Path(".").rglob("*.pyc"):
-        pyc_file.unlink(missing_ok=True)
+    remove_python_caches()
 
 
 def main() -> int:
@@ -7,6 +7,17 @@ import os
 
 def generate_icon():
     """生成一个简单的文档图标"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    ico_path = os.path.join(script_dir, 'app_icon.ico')
+    png_path = os.path.join(script_dir, 'app_icon.png')
+    
+    # 图标参数都写在本脚本中，已生成的图标比脚本新时无需重新绘制
+    src_mtime = os.path.getmtime(__file__)
+    if (os.path.exists(ico_path) and os.path.exists(png_path)
+            and min(os.path.getmtime(ico_path), os.path.getmtime(png_path)) >= src_mtime):
+        print("图标已是最新，跳过生成")
+        return
+    
     # 创建 256x256 的图像
     size = 256
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
@@ -46,20 +57,19 @@ def generate_icon():
         y = line_y_start + i * line_spacing
         # 最后一行短一些
         end_x = size - line_margin - (40 if i == 3 else 0)
-        draw.rectangle([line_margin, y, end_x, y + 8], fill=line_color)
+        # 直接填充矩形区域像素（与 draw.rectangle 的闭区间 [x0, y0, x1, y1] 覆盖相同像素）
+        img.paste(line_color, (line_margin, y, end_x + 1, y + 9))
     
     # 保存为 ICO 和 PNG
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
     # 保存多尺寸 ICO
     ico_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    ico_images = [img.resize(s, Image.Resampling.LANCZOS) for s in ico_sizes]
-    ico_path = os.path.join(script_dir, 'app_icon.ico')
+    # 小尺寸下LANCZOS与BILINEAR效果无明显差别，仅大尺寸使用LANCZOS
+    ico_images = [img.resize(s, Image.Resampling.LANCZOS if s[0] >= 128 else Image.Resampling.BILINEAR)
+                  for s in ico_sizes]
     ico_images[0].save(ico_path, format='ICO', sizes=ico_sizes, append_images=ico_images[1:])
     print(f"已生成: {ico_path}")
     
     # 保存 PNG
-    png_path = os.path.join(script_dir, 'app_icon.png')
     img.save(png_path, format='PNG')
     print(f"已生成: {png_path}")
 
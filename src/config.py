@@ -5,18 +5,93 @@
 配置管理模块
 """
 
+import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
+# PyYAML 按需导入，首次读写YAML配置时加载并缓存
+_yaml = None
+_YamlLoader = None
+_YamlDumper = None
+
+# 已解析的配置文件缓存：绝对路径 -> (文件mtime_ns, 配置数据)，文件修改后自动失效
+_CFG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _load_yaml():
+    """导入PyYAML（仅首次调用时导入）
+    
+    Returns:
+        yaml模块
+        
+    Raises:
+        ValueError: 未安装PyYAML
+    """
+    global _yaml, _YamlLoader, _YamlDumper
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML格式需要安装PyYAML: pip install PyYAML")
+        # 优先使用libyaml提供的C实现，不可用时回退到纯Python实现
+        try:
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+        _yaml, _YamlLoader, _YamlDumper = yaml, loader, dumper
+    return _yaml
+
+
+def _config_format(config_file: Path) -> str:
+    """根据扩展名确定配置文件格式（.json以外的扩展名均按YAML处理）
+    
+    Args:
+        config_file: 配置文件路径
+        
+    Returns:
+        'json' 或 'yaml'
+    """
+    return 'json' if config_file.suffix.lower() == '.json' else 'yaml'
+
+
+def _read_json(f) -> Dict[str, Any]:
+    """读取JSON配置"""
+    return json.load(f)
+
+
+def _read_yaml(f) -> Dict[str, Any]:
+    """读取YAML配置"""
+    return _load_yaml().load(f, Loader=_YamlLoader)
+
+
+def _write_json(config_data: Dict[str, Any], f) -> None:
+    """写入JSON配置"""
+    json.dump(config_data, f, ensure_ascii=False, indent=2)
+
+
+def _write_yaml(config_data: Dict[str, Any], f) -> None:
+    """写入YAML配置"""
+    _load_yaml().dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False,
+                      allow_unicode=True, indent=2, sort_keys=False)
+
+
+# 各配置格式的读写函数
+_READERS = {'json': _read_json, 'yaml': _read_yaml}
+_WRITERS = {'json': _write_json, 'yaml': _write_yaml}
 
 
 class Config:
     """配置管理类"""
     
+    # 固定属性集合，省去每个实例的属性字典
+    __slots__ = (
+        'text_width', 'text_indent', 'heading_prefix',
+        'base_column_width', 'level_2_multiplier', 'level_3_multiplier',
+        'cell_padding', 'cell_left_padding',
+        'preserve_structure', 'merge_consecutive_empty_lines',
+        'skip_temp_files', 'recursive_search', 'max_workers',
+    )
+    
     def __init__(self) -> None:
         """初始化默认配置"""
         # 文本格式配置
@@ -38,6 +113,7 @@ class Config:
         # 处理配置
         self.skip_temp_files: bool = True  # 跳过~$开头的临时文件
         self.recursive_search: bool = False
+        self.max_workers: int = 0  # 批量处理的并行进程数，0表示使用CPU核心数
         
     def load_from_file(self, config_path: str) -> None:
         """从配置文件加载配置
@@ -52,30 +128,32 @@ class Config:
         """
         config_file = Path(config_path)
         
-        if not config_file.exists():
+        try:
+            st = config_file.stat()
+        except OSError:
             raise FileNotFoundError(f"配置文件不存在: {config_path}")
         
+        cache_key = str(config_file.resolve())
+        cached = _CFG_CACHE.get(cache_key)
+        if cached and cached[0] == st.st_mtime_ns:
+            self._update_from_dict(cached[1])
+            return
+        
+        # 根据文件扩展名选择解析方式，未安装PyYAML时在打开文件前报错
+        fmt = _config_format(config_file)
+        if fmt == 'yaml':
+            _load_yaml()
+        
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                # 根据文件扩展名选择解析方式
-                if config_file.suffix.lower() in ['.yaml', '.yml']:
-                    if yaml is None:
-                        raise ValueError("YAML格式需要安装PyYAML: pip install PyYAML")
-                    config_data = yaml.safe_load(f)
-                elif config_file.suffix.lower() == '.json':
-                    import json
-                    config_data = json.load(f)
-                else:
-                    # 默认尝试YAML格式
-                    if yaml is None:
-                        raise ValueError("YAML格式需要安装PyYAML: pip install PyYAML")
-                    config_data = yaml.safe_load(f)
+                config_data = _READERS[fmt](f)
             
             self._update_from_dict(config_data)
+            _CFG_CACHE[cache_key] = (st.st_mtime_ns, config_data)
             
-        except yaml.YAMLError as e:
-            raise ValueError(f"YAML配置文件格式错误: {e}")
         except Exception as e:
+            if _yaml is not None and isinstance(e, _yaml.YAMLError):
+                raise ValueError(f"YAML配置文件格式错误: {e}")
             raise RuntimeError(f"加载配置文件失败: {e}")
     
     def save_to_file(self, config_path: str) -> None:
@@ -93,23 +171,14 @@ class Config:
         config_file = Path(config_path)
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # 根据文件扩展名选择保存格式，未安装PyYAML时在打开（清空）文件前报错
+        fmt = _config_format(config_file)
+        if fmt == 'yaml':
+            _load_yaml()
+        
         try:
             with open(config_file, 'w', encoding='utf-8') as f:
-                # 根据文件扩展名选择保存格式
-                if config_file.suffix.lower() in ['.yaml', '.yml']:
-                    if yaml is None:
-                        raise ValueError("YAML格式需要安装PyYAML: pip install PyYAML")
-                    yaml.dump(config_data, f, default_flow_style=False, 
-                             allow_unicode=True, indent=2, sort_keys=False)
-                elif config_file.suffix.lower() == '.json':
-                    import json
-                    json.dump(config_data, f, ensure_ascii=False, indent=2)
-                else:
-                    # 默认使用YAML格式
-                    if yaml is None:
-                        raise ValueError("YAML格式需要安装PyYAML: pip install PyYAML")
-                    yaml.dump(config_data, f, default_flow_style=False, 
-                             allow_unicode=True, indent=2, sort_keys=False)
+                _WRITERS[fmt](config_data, f)
         except Exception as e:
             raise RuntimeError(f"保存配置文件失败: {e}")
     
@@ -149,6 +218,7 @@ class Config:
             # 处理配置
             'skip_temp_files': self.skip_temp_files,
             'recursive_search': self.recursive_search,
+            'max_workers': self.max_workers,
         }
     
     @classmethod
@@ -7,10 +7,16 @@ DOCX文档提取器核心模块
 """
 
 import logging
+import logging.handlers
 import os
 import re
+import stat
 import hashlib
-from typing import Dict, List, Tuple, Optional, Any
+import io
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Iterator, List, Tuple, Optional, Any, Union
 
 from docx import Document
 
@@ -38,6 +44,54 @@ BASE_COLUMN_WIDTH = 15  # 基础列宽
 LEVEL_2_MULTIPLIER = 2  # Level 2 宽度倍数
 LEVEL_3_MULTIPLIER = 3  # Level 3 宽度倍数
 
+# 换行分词：连续的ASCII非空白字符为一个词，空白字符和非ASCII字符（如中文）各自单独成词
+_TOKEN_RE = re.compile(r'[^\s\x80-\U0010ffff]+|\s|[^\x00-\x7f]')
+
+# 标题规范化时的全角→半角标点映射
+_FULLWIDTH_PUNCT = str.maketrans({'（': '(', '）': ')'})
+
+# 逐行strip并拼接后的多余空行：连续空行中只保留第一个
+_BLANK_RUN_RE = re.compile(r'(?:\A|(?<=\n))\n(?=\n|\Z)')
+
+# CMD标注相关正则（字符类实现大小写不敏感，避免 re.IGNORECASE 的Unicode大小写折叠开销）
+_CMD_WORD_RE = re.compile(r'\b[Cc][Mm][Dd]\b')                  # 独立的cmd单词
+_CMD_VALUE_RE = re.compile(r'[Cc][Mm][Dd]\s*=\s*(\d+)')         # cmd=编号
+_CMD_TAG_RE = re.compile(r'\[\s*[Cc][Mm][Dd]\s*=\s*\d+\s*\]')   # 标准标注 [cmd=xxx]
+
+
+@lru_cache(maxsize=2048)
+def _short_digest(text: str) -> str:
+    """计算文本的8位十六进制短哈希（用于标题锚点，重复标题直接命中缓存）
+    
+    保持使用SHA1，以免已生成文档中的 sec-xxxxxxxx 锚点发生变化。
+    """
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:8]
+
+
+class CellData:
+    """表格单元格的格式化数据（__slots__ 布局，比字典更省内存、属性访问更快）"""
+    
+    __slots__ = ('text', 'lines', 'hspan', 'vspan', 'needs_double_width', 'max_line_width')
+    
+    def __init__(self, text: str = '', lines: Optional[List[str]] = None, hspan: int = 1, vspan: int = 1,
+                 needs_double_width: bool = False, max_line_width: int = 0) -> None:
+        """初始化单元格数据
+        
+        Args:
+            text: 清理后的单元格文本
+            lines: 单元格文本行（默认为单个空行）
+            hspan: 横向合并列数
+            vspan: 纵向合并行数（0表示被上方单元格合并）
+            needs_double_width: 换行较多、需要加宽列
+            max_line_width: 最长一行的显示宽度
+        """
+        self.text = text
+        self.lines = lines if lines is not None else ['']
+        self.hspan = hspan
+        self.vspan = vspan
+        self.needs_double_width = needs_double_width
+        self.max_line_width = max_line_width
+
 
 class DocumentExtractor:
     """DOCX文档提取器核心类"""
@@ -49,15 +103,21 @@ class DocumentExtractor:
             config: 可选配置对象，需包含 text_width/text_indent 等属性
         """
         self.logger: logging.Logger = logging.getLogger(__name__)
-        self.current_table = None
         # 配置相关（带默认值，避免强耦合），固定输出md格式
         self.text_width: int = getattr(config, 'text_width', 100) if config else 100
         self.text_indent: str = getattr(config, 'text_indent', DEFAULT_INDENT) if config else DEFAULT_INDENT
         
-    def _get_char_width(self, char: str) -> int:
-        """获取字符的显示宽度"""
-        return DOUBLE_CHAR_WIDTH if ord(char) > UNICODE_BOUNDARY else SINGLE_CHAR_WIDTH
-    
+        # 表格格式配置在初始化时一次性解析为整数，热点循环中直接使用
+        base_width = getattr(config, 'base_column_width', BASE_COLUMN_WIDTH) if config else BASE_COLUMN_WIDTH
+        level_2 = getattr(config, 'level_2_multiplier', LEVEL_2_MULTIPLIER) if config else LEVEL_2_MULTIPLIER
+        level_3 = getattr(config, 'level_3_multiplier', LEVEL_3_MULTIPLIER) if config else LEVEL_3_MULTIPLIER
+        self._base_width: int = base_width
+        self._level_2_width: int = base_width * level_2
+        self._level_3_width: int = base_width * level_3
+        self._cell_padding: int = getattr(config, 'cell_padding', CELL_PADDING) if config else CELL_PADDING
+        self._cell_left_padding: int = (getattr(config, 'cell_left_padding', CELL_LEFT_PADDING)
+                                        if config else CELL_LEFT_PADDING)
+        
     def _get_string_width(self, text: str) -> int:
         """获取字符串的显示宽度
         
@@ -67,91 +127,79 @@ class DocumentExtractor:
         Returns:
             字符串的显示宽度
         """
-        return sum(self._get_char_width(char) for char in str(text))
+        text = str(text)
+        # 按ASCII编码时忽略的字符即为双宽字符（码点大于127），宽度计算全部在C层完成
+        return DOUBLE_CHAR_WIDTH * len(text) - len(text.encode('ascii', 'ignore'))
     
     def _clean_text(self, text: str) -> str:
         """清理文本内容，保留必要的格式，合并连续空行为一行"""
         if not text:
             return ""
+        # 单行文本（绝大多数表格单元格）无需分行和合并空行
+        if '\n' not in text:
+            return text.strip()
         
-        lines = text.split('\n')
-        cleaned_lines = [line.strip() for line in lines]
-        
-        # 合并连续的空行为单个空行
-        result_lines = []
-        prev_empty = False
+        # 逐行去除首尾空白后，由正则一次性合并连续的空行
+        joined = '\n'.join([line.strip() for line in text.split('\n')])
+        return _BLANK_RUN_RE.sub('', joined)
+    
+    def _process_heading(self, paragraph, style_name: str) -> str:
+        """处理标题段落（在 md 模式下注入稳定锚点）
         
-        for line in cleaned_lines:
-            is_empty = not line
+        Args:
+            paragraph: 段落对象
+            style_name: 已转为小写的段落样式名
             
-            if is_empty:
-                if not prev_empty:
-                    result_lines.append(line)
-                prev_empty = True
-            else:
-                result_lines.append(line)
-                prev_empty = False
-        
-        return '\n'.join(result_lines)
-    
-    def _process_heading(self, paragraph) -> str:
-        """处理标题段落（在 md 模式下注入稳定锚点）"""
+        Returns:
+            格式化后的标题文本
+        """
         text = paragraph.text.strip()
         if not text:
             return ""
         
         # 标题级别
-        level = paragraph.style.name.lower()
         level_num = None
-        if 'heading' in level:
+        if 'heading' in style_name:
             try:
-                level_num = int(level[-1])
+                level_num = int(style_name[-1])
             except ValueError:
                 level_num = None
 
         prefix = (HEADING_PREFIX * level_num + ' ') if level_num else (HEADING_PREFIX + ' ')
 
         # 规范 cmd 标注与锚点
-        norm_text = text.replace('（', '(').replace('）', ')')
-        # 归一化 cmd 大小写与空格
-        norm_text = re.sub(r'\bCMD\b', 'cmd', norm_text, flags=re.I)
-        cmd_match = re.search(r'cmd\s*=\s*(\d+)', norm_text, flags=re.I)
-        anchor_line = ''
+        norm_text, anchor_line = self._normalize_cmd(text)
+        return f"{anchor_line}{prefix}{norm_text}\n"
+    
+    def _normalize_cmd(self, text: str) -> Tuple[str, str]:
+        """规范化标题中的cmd标注并生成锚点行
+        
+        全角括号转半角、统一cmd大小写；含 cmd=编号 时补全标准标注 [cmd=xxx] 并使用
+        cmd-xxx 锚点，否则使用基于内容短哈希的 sec-xxxxxxxx 锚点。
+        
+        Args:
+            text: 标题文本
+            
+        Returns:
+            (规范化后的文本, 锚点行)
+        """
+        norm_text = text.translate(_FULLWIDTH_PUNCT)
+        norm_text = _CMD_WORD_RE.sub('cmd', norm_text)
+        cmd_match = _CMD_VALUE_RE.search(norm_text)
         if cmd_match:
             cmd_val = int(cmd_match.group(1))
             anchor_id = f"cmd-{cmd_val:03d}"
             # 若文本未带标准 [cmd=xxx]，追加标准化标注
-            if not re.search(r'\[\s*cmd\s*=\s*\d+\s*\]', norm_text, flags=re.I):
+            if not _CMD_TAG_RE.search(norm_text):
                 norm_text = f"{norm_text} [cmd={cmd_val:03d}]"
-            anchor_line = f"<a id=\"{anchor_id}\"></a>\n"
         else:
             # 为无 cmd 的标题生成稳定锚点（基于内容的短哈希）
-            digest = hashlib.sha1(norm_text.encode('utf-8')).hexdigest()[:8]
-            anchor_id = f"sec-{digest}"
-            anchor_line = f"<a id=\"{anchor_id}\"></a>\n"
-        return f"{anchor_line}{prefix}{norm_text}\n"
+            anchor_id = f"sec-{_short_digest(norm_text)}"
+        return norm_text, f"<a id=\"{anchor_id}\"></a>\n"
     
     def _process_pseudo_cmd_title(self, text: str) -> str:
         """处理伪CMD标题（普通段落中识别的CMD格式）"""
-        # 规范化文本：全角→半角，统一cmd大小写
-        norm_text = text.replace('（', '(').replace('）', ')')
-        norm_text = re.sub(r'\bCMD\b', 'cmd', norm_text, flags=re.I)
-        
-        # 提取 CMD 编号
-        cmd_match = re.search(r'cmd\s*=\s*(\d+)', norm_text, flags=re.I)
-        anchor_line = ''
-        if cmd_match:
-            cmd_val = int(cmd_match.group(1))
-            anchor_id = f"cmd-{cmd_val:03d}"
-            # 若文本未带标准 [cmd=xxx]，追加标准化标注
-            if not re.search(r'\[\s*cmd\s*=\s*\d+\s*\]', norm_text, flags=re.I):
-                norm_text = f"{norm_text} [cmd={cmd_val:03d}]"
-            anchor_line = f"<a id=\"{anchor_id}\"></a>\n"
-        else:
-            # 生成基于内容的哈希锚点（备用）
-            digest = hashlib.sha1(norm_text.encode('utf-8')).hexdigest()[:8]
-            anchor_id = f"sec-{digest}"
-            anchor_line = f"<a id=\"{anchor_id}\"></a>\n"
+        norm_text, anchor_line = self._normalize_cmd(text)
         
         # 作为三级标题输出
         return f"{anchor_line}### {norm_text}\n\n"
@@ -164,52 +212,36 @@ class DocumentExtractor:
         indent_width = self._get_string_width(indent)
         available_width = max_width - indent_width
         
-        result_lines = []
-        current_line = []
-        current_width = 0
+        # 分词后按宽度分行（纯ASCII文本的显示宽度即字符数，直接用len计算词宽）
+        result_lines = self._break_lines(_TOKEN_RE.findall(text), available_width, text.isascii())
+            
+        return "\n".join(indent + line.strip() for line in result_lines)
+    
+    def _break_lines(self, words: List[str], available_width: int, ascii_only: bool = False) -> List[str]:
+        """按显示宽度对词序列贪心分行
         
-        # 分词处理
-        words = []
-        temp_word = ""
+        每行尽可能多地容纳词且宽度不超过 available_width，单个超宽的词独占一行。
+        先计算词宽度的前缀和，再用二分查找直接定位每行的结束位置，无需逐词累加比较。
         
-        for char in text:
-            if char.isspace():
-                if temp_word:
-                    words.append(temp_word)
-                    temp_word = ""
-                words.append(char)
-            else:
-                if ord(char) > 127:  # 中文字符单独作为词
-                    if temp_word:
-                        words.append(temp_word)
-                        temp_word = ""
-                    words.append(char)
-                else:
-                    temp_word += char
-        if temp_word:
-            words.append(temp_word)
-            
-        # 按宽度分行
-        for word in words:
-            word_width = self._get_string_width(word)
-            
-            if not current_line:
-                current_line.append(word)
-                current_width = word_width
-                continue
-                
-            if current_width + word_width <= available_width:
-                current_line.append(word)
-                current_width += word_width
-            else:
-                result_lines.append("".join(current_line))
-                current_line = [word]
-                current_width = word_width
-                
-        if current_line:
-            result_lines.append("".join(current_line))
+        Args:
+            words: 分词结果
+            available_width: 每行可用宽度
+            ascii_only: 词序列是否全部为ASCII字符（为True时以len作为词宽，跳过宽度计算）
             
-        return "\n".join(indent + line.strip() for line in result_lines)
+        Returns:
+            分行后的文本列表
+        """
+        measure = len if ascii_only else self._get_string_width
+        prefix = list(accumulate(map(measure, words), initial=0))
+        lines = []
+        start = 0
+        while start < len(words):
+            end = bisect_right(prefix, prefix[start] + available_width, start + 1) - 1
+            if end == start:
+                end += 1
+            lines.append(''.join(words[start:end]))
+            start = end
+        return lines
     
     def _process_normal_paragraph(self, paragraph) -> str:
         """处理普通段落"""
@@ -218,16 +250,6 @@ class DocumentExtractor:
             
         text = paragraph.text.strip()
         
-        if paragraph.style and 'heading' in paragraph.style.name.lower():
-            try:
-                level = int(paragraph.style.name.lower()[-1])
-                prefix = HEADING_PREFIX * level + ' '
-                # 走标题处理，保证锚点一致
-                return self._process_heading(paragraph) + "\n"
-            except ValueError:
-                prefix = HEADING_PREFIX + ' '
-                return f"{prefix}{text}\n\n"
-        
         # 识别形如 "x.x.x (CMD=xxx)" 的伪标题段落
         cmd_pattern = r'^\s*\d+\.\d+(?:\.\d+)?\s*\([Cc][Mm][Dd]\s*=\s*\d+\)'
         if re.match(cmd_pattern, text):
@@ -238,58 +260,59 @@ class DocumentExtractor:
         return wrapped_text + "\n\n"
     
     # 表格处理相关方法（保持原有复杂逻辑）
-    def _get_merged_cell_info(self, cell, row_idx: int, col_idx: int) -> Tuple[int, int]:
-        """获取单元格的合并信息"""
-        vmerge = cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge")
-        hmerge = cell._tc.get_or_add_tcPr().first_child_found_in("w:gridSpan")
+    def _read_cell_props(self, cell) -> Tuple[Optional[str], int, str]:
+        """读取单元格的合并属性和文本
         
-        vspan = 1
-        hspan = int(hmerge.val) if hmerge is not None else 1
+        Args:
+            cell: python-docx 单元格对象
+            
+        Returns:
+            (vMerge取值（无纵向合并时为None）, 横向合并列数, 单元格原始文本)
+        """
+        tc_pr = cell._tc.tcPr
+        vmerge = hmerge = None
+        if tc_pr is not None:
+            vmerge = tc_pr.first_child_found_in("w:vMerge")
+            hmerge = tc_pr.first_child_found_in("w:gridSpan")
+        return (vmerge.val if vmerge is not None else None,
+                int(hmerge.val) if hmerge is not None else 1,
+                cell.text)
+    
+    def _get_merged_cell_info(self, grid: List[List[Tuple[Optional[str], int, str]]],
+                              row_idx: int, col_idx: int) -> Tuple[int, int]:
+        """获取单元格的合并信息
+        
+        纵向合并的续行单元格（vMerge=continue）由其起始单元格统一计算，调用方应直接跳过。
         
-        if vmerge is not None:
-            current_text = cell.text.strip()
+        Args:
+            grid: 表格各单元格的 (vMerge取值, 横向合并列数, 原始文本) 缓存
+            row_idx: 行索引
+            col_idx: 列索引
             
-            if vmerge.val == "restart":
-                current_row = row_idx + 1
-                while current_row < len(self.current_table.rows):
-                    next_cell = self.current_table.rows[current_row].cells[col_idx]
-                    next_vmerge = next_cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge")
-                    next_text = next_cell.text.strip()
-                    
-                    should_merge = (next_vmerge is not None and 
-                                  (next_vmerge.val != "restart") and
-                                  (not current_text or 
-                                   not next_text or 
-                                   current_text == next_text))
-                    
-                    if not should_merge:
-                        break
-                        
-                    vspan += 1
-                    current_row += 1
-                    
-            else:
-                current_row = row_idx - 1
-                found_start = False
+        Returns:
+            (纵向合并行数, 横向合并列数)
+        """
+        vmerge, hspan, text = grid[row_idx][col_idx]
+        vspan = 1
+        
+        if vmerge == "restart":
+            current_text = text.strip()
+            current_row = row_idx + 1
+            while current_row < len(grid):
+                next_vmerge, _, next_text = grid[current_row][col_idx]
+                next_text = next_text.strip()
                 
-                while current_row >= 0:
-                    prev_cell = self.current_table.rows[current_row].cells[col_idx]
-                    prev_vmerge = prev_cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge")
-                    prev_text = prev_cell.text.strip()
-                    
-                    if (prev_vmerge is not None and 
-                        prev_vmerge.val == "restart" and
-                        (not current_text or 
-                         not prev_text or 
-                         current_text == prev_text)):
-                        found_start = True
-                        vspan = 0
-                        break
-                        
-                    current_row -= 1
+                should_merge = (next_vmerge is not None and 
+                              (next_vmerge != "restart") and
+                              (not current_text or 
+                               not next_text or 
+                               current_text == next_text))
+                
+                if not should_merge:
+                    break
                     
-                if not found_start:
-                    vspan = 1
+                vspan += 1
+                current_row += 1
                 
         return vspan, hspan
     
@@ -299,7 +322,7 @@ class DocumentExtractor:
             return ['']
         
         wrapped_lines = []
-        available_width = total_width - CELL_PADDING
+        available_width = total_width - self._cell_padding
         
         lines = cell_text.split('\n')
         
@@ -308,205 +331,163 @@ class DocumentExtractor:
                 wrapped_lines.append('')
                 continue
             
-            current_line = []
-            current_width = 0
-            
-            words = []
-            temp_word = ""
-            
-            for char in line:
-                if char.isspace():
-                    if temp_word:
-                        words.append(temp_word)
-                        temp_word = ""
-                    words.append(char)
-                else:
-                    if ord(char) > 127:
-                        if temp_word:
-                            words.append(temp_word)
-                            temp_word = ""
-                        words.append(char)
-                    else:
-                        temp_word += char
-            if temp_word:
-                words.append(temp_word)
-            
-            for word in words:
-                word_width = self._get_string_width(word)
-                
-                if current_width + word_width <= available_width:
-                    current_line.append(word)
-                    current_width += word_width
-                else:
-                    if current_line:
-                        wrapped_lines.append(''.join(current_line))
-                    current_line = [word]
-                    current_width = word_width
-            
-            if current_line:
-                wrapped_lines.append(''.join(current_line))
+            wrapped_lines.extend(self._break_lines(_TOKEN_RE.findall(line), available_width, line.isascii()))
         
         return wrapped_lines if wrapped_lines else ['']
     
-    def _calculate_column_widths(self, table_data: List[List[Dict]], max_cols: int) -> List[int]:
+    def _calculate_column_widths(self, table_data: List[List[CellData]], max_cols: int) -> List[int]:
         """计算表格每列的宽度"""
         col_widths = [0] * max_cols
         max_content_widths = [0] * max_cols
         
         for row_data in table_data:
             for col_idx, cell_data in enumerate(row_data):
-                if cell_data['hspan'] == 1:
-                    content_width = cell_data['max_line_width']
+                if cell_data.hspan == 1:
+                    content_width = cell_data.max_line_width
                     max_content_widths[col_idx] = max(max_content_widths[col_idx], content_width)
         
+        base_width = self._base_width
+        level_2_width = self._level_2_width
+        level_3_width = self._level_3_width
         for col_idx in range(max_cols):
             max_width = max_content_widths[col_idx]
-            if max_width <= BASE_COLUMN_WIDTH:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH
-            elif max_width <= BASE_COLUMN_WIDTH * LEVEL_2_MULTIPLIER:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH * LEVEL_2_MULTIPLIER
-            elif max_width <= BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER
+            if max_width <= base_width:
+                col_widths[col_idx] = base_width
+            elif max_width <= level_2_width:
+                col_widths[col_idx] = level_2_width
+            elif max_width <= level_3_width:
+                col_widths[col_idx] = level_3_width
             else:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER
-            
-        for row_data in table_data:
-            for col_idx, cell_data in enumerate(row_data):
-                if cell_data['hspan'] > 1:
-                    total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + cell_data['hspan'], len(col_widths))))
-                    cell_data['available_width'] = total_width - CELL_PADDING
+                col_widths[col_idx] = level_3_width
         
         return col_widths
     
-    def _format_table_row(self, row_data: List[Dict], col_widths: List[int], line_idx: int) -> str:
+    def _span_width(self, col_prefix: List[int], col_idx: int, hspan: int) -> int:
+        """计算从 col_idx 列起横跨 hspan 列的总宽度（含被合并的列分隔符）
+        
+        Args:
+            col_prefix: 列宽前缀和，col_prefix[i] 为前 i 列宽度之和
+            col_idx: 起始列索引
+            hspan: 横向合并列数
+            
+        Returns:
+            合并后的总宽度
+        """
+        end = max(col_idx, min(col_idx + hspan, len(col_prefix) - 1))
+        return col_prefix[end] - col_prefix[col_idx] + (hspan - 1)
+    
+    def _format_table_row(self, row_data: List[CellData], col_prefix: List[int], line_idx: int) -> str:
         """格式化表格行"""
-        row_content = '|'
+        parts = ['|']
+        left_padding = self._cell_left_padding
         col_idx = 0
         
         while col_idx < len(row_data):
             cell_data = row_data[col_idx]
-            hspan = cell_data['hspan']
+            hspan = cell_data.hspan
             
-            total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + hspan, len(col_widths)))) + (hspan - 1)
+            total_width = self._span_width(col_prefix, col_idx, hspan)
             
-            if cell_data['vspan'] == 0:
+            if cell_data.vspan == 0:
                 cell_text = ''
             else:
-                cell_text = cell_data['lines'][line_idx] if line_idx < len(cell_data['lines']) else ''
+                cell_text = cell_data.lines[line_idx] if line_idx < len(cell_data.lines) else ''
             
             content_width = self._get_string_width(cell_text)
-            left_padding = CELL_LEFT_PADDING
             right_padding = total_width - content_width - left_padding
             
-            row_content += ' ' * left_padding + cell_text + ' ' * right_padding + '|'
+            parts.extend((' ' * left_padding, cell_text, ' ' * right_padding, '|'))
             
             col_idx += hspan
         
-        return row_content
+        return ''.join(parts)
     
-    def _collect_table_data(self, table) -> Tuple[List[List[Dict]], int]:
+    def _collect_table_data(self, table) -> Tuple[List[List[CellData]], int]:
         """收集表格数据和合并单元格信息"""
-        max_cols = max(len(row.cells) for row in table.rows)
+        # row.cells 每次访问都要重新展开表格网格，只取一次
+        rows_cells = [row.cells for row in table.rows]
+        max_cols = max(map(len, rows_cells))
         table_data = []
         
-        for row_idx, row in enumerate(table.rows):
+        # 一次性读取所有单元格的合并属性和文本，合并计算时直接复用，避免重复访问XML
+        grid = [[self._read_cell_props(cell) for cell in cells] for cells in rows_cells]
+        
+        for row_idx, row_props in enumerate(grid):
             row_data = []
-            for col_idx, cell in enumerate(row.cells):
-                vspan, hspan = self._get_merged_cell_info(cell, row_idx, col_idx)
-                
-                if cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge") is not None and \
-                   cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge").val != "restart":
+            for col_idx, (vmerge, _, text) in enumerate(row_props):
+                # 纵向合并的续行单元格由起始单元格统一处理
+                if vmerge is not None and vmerge != "restart":
                     continue
                 
-                cell_text = self._clean_text(cell.text)
+                vspan, hspan = self._get_merged_cell_info(grid, row_idx, col_idx)
+                
+                cell_text = self._clean_text(text)
                 original_lines = cell_text.split('\n')
                 line_widths = [self._get_string_width(line) for line in original_lines]
                 max_line_width = max(line_widths) if line_widths else 0
                 
                 needs_double_width = len(original_lines) - 1 >= NEWLINE_THRESHOLD
                 
-                row_data.append({
-                    'text': cell_text,
-                    'lines': original_lines,
-                    'hspan': hspan,
-                    'vspan': vspan,
-                    'needs_double_width': needs_double_width,
-                    'max_line_width': max_line_width
-                })
+                row_data.append(CellData(cell_text, original_lines, hspan, vspan,
+                                         needs_double_width, max_line_width))
             
             while len(row_data) < max_cols:
-                row_data.append({
-                    'text': '',
-                    'lines': [''],
-                    'hspan': 1,
-                    'vspan': 1,
-                    'needs_double_width': False,
-                    'max_line_width': 0
-                })
+                row_data.append(CellData())
                 
             table_data.append(row_data)
             
         return table_data, max_cols
 
-    def _process_cell_wrapping(self, table_data: List[List[Dict]], col_widths: List[int]):
+    def _process_cell_wrapping(self, table_data: List[List[CellData]], col_prefix: List[int]):
         """处理所有单元格的文本换行"""
         for row_idx, row_data in enumerate(table_data):
             for col_idx, cell_data in enumerate(row_data):
-                if cell_data['vspan'] > 1:
-                    h_total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + cell_data['hspan'], len(col_widths)))) + (cell_data['hspan'] - 1)
+                if cell_data.vspan > 1:
+                    h_total_width = self._span_width(col_prefix, col_idx, cell_data.hspan)
                     
-                    if cell_data['text']:
-                        cell_data['lines'] = self._process_cell_content(cell_data['text'], h_total_width)
+                    if cell_data.text:
+                        cell_data.lines = self._process_cell_content(cell_data.text, h_total_width)
                         
-                    for v_idx in range(row_idx + 1, min(row_idx + cell_data['vspan'], len(table_data))):
-                        table_data[v_idx][col_idx] = {
-                            'text': '',
-                            'lines': [''],
-                            'hspan': cell_data['hspan'],
-                            'vspan': 0,
-                            'needs_double_width': False,
-                            'max_line_width': 0,
-                            'merged_from': (row_idx, col_idx)
-                        }
+                    for v_idx in range(row_idx + 1, min(row_idx + cell_data.vspan, len(table_data))):
+                        table_data[v_idx][col_idx] = CellData(hspan=cell_data.hspan, vspan=0)
         
         for row_idx, row_data in enumerate(table_data):
             for col_idx, cell_data in enumerate(row_data):
-                if cell_data['vspan'] == 1:
-                    if not cell_data['text']:
-                        cell_data['lines'] = ['']
+                if cell_data.vspan == 1:
+                    if not cell_data.text:
+                        cell_data.lines = ['']
                         continue
                     
-                    total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + cell_data['hspan'], len(col_widths)))) + (cell_data['hspan'] - 1)
-                    cell_data['lines'] = self._process_cell_content(cell_data['text'], total_width)
+                    total_width = self._span_width(col_prefix, col_idx, cell_data.hspan)
+                    cell_data.lines = self._process_cell_content(cell_data.text, total_width)
 
-    def _generate_table_string(self, table_data: List[List[Dict]], col_widths: List[int]) -> str:
+    def _generate_table_string(self, table_data: List[List[CellData]], col_widths: List[int],
+                               col_prefix: List[int]) -> str:
         """生成最终的表格字符串"""
         result = []
         
-        separator = '+'
-        for width in col_widths:
-            separator += '-' * width + '+'
+        separator = '+' + ''.join(['-' * width + '+' for width in col_widths])
         
         for row_idx, row_data in enumerate(table_data):
             max_lines = 1
             for cell_data in row_data:
-                if cell_data['vspan'] != 0:
-                    max_lines = max(max_lines, len(cell_data['lines']))
+                if cell_data.vspan != 0:
+                    max_lines = max(max_lines, len(cell_data.lines))
             
             for cell_data in row_data:
-                if cell_data['vspan'] != 0:
-                    if not cell_data['lines']:
-                        cell_data['lines'] = ['']
-                    while len(cell_data['lines']) < max_lines:
-                        cell_data['lines'].append('')
+                if cell_data.vspan != 0:
+                    if not cell_data.lines:
+                        cell_data.lines = ['']
+                    while len(cell_data.lines) < max_lines:
+                        cell_data.lines.append('')
             
             if (row_idx == 0 or 
-                not any(cell_data['vspan'] == 0 for cell_data in row_data) or
-                any(cell_data['vspan'] > 1 for cell_data in row_data)):
+                not any(cell_data.vspan == 0 for cell_data in row_data) or
+                any(cell_data.vspan > 1 for cell_data in row_data)):
                 result.append(separator)
             
             for line_idx in range(max_lines):
-                result.append(self._format_table_row(row_data, col_widths, line_idx))
+                result.append(self._format_table_row(row_data, col_prefix, line_idx))
         
         result.append(separator)
         ascii_table = '\n'.join(result) + '\n'
@@ -520,12 +501,12 @@ class DocumentExtractor:
             if not table.rows:
                 return "\n"
                 
-            self.current_table = table
-            
             table_data, max_cols = self._collect_table_data(table)
             col_widths = self._calculate_column_widths(table_data, max_cols)
-            self._process_cell_wrapping(table_data, col_widths)
-            result = self._generate_table_string(table_data, col_widths)
+            # 列宽前缀和：任意连续列的总宽度都可 O(1) 求得
+            col_prefix = list(accumulate(col_widths, initial=0))
+            self._process_cell_wrapping(table_data, col_prefix)
+            result = self._generate_table_string(table_data, col_widths, col_prefix)
             
             return result
             
@@ -535,73 +516,216 @@ class DocumentExtractor:
     
     def extract_content(self, docx_path: str) -> str:
         """提取DOCX内容并返回格式化文本"""
+        return ''.join(self.iter_content(docx_path))
+    
+    def iter_content(self, docx_path: str) -> Iterator[str]:
+        """提取DOCX内容，按文档元素逐块返回格式化文本
+        
+        文档在调用时立即加载（文件不存在等错误在此处抛出），各元素的文本在迭代时
+        逐个生成，便于调用方边提取边写入文件。
+        
+        Args:
+            docx_path: DOCX文件路径
+            
+        Returns:
+            格式化文本块的迭代器
+        """
         file_name = docx_path.split('\\')[-1].split('/')[-1]
         self.logger.info(f"开始处理: {file_name}")
         
         try:
-            doc = Document(docx_path)
-            content = []
-            
+            # 整个文件一次读入内存，python-docx解析ZIP时的定位和读取都在内存中完成
+            with open(docx_path, 'rb') as f:
+                doc = Document(io.BytesIO(f.read()))
+        except Exception as e:
+            self._report_extract_error(e, file_name, 0)
+            raise
+        return self._iter_elements(doc, file_name)
+    
+    def _iter_elements(self, doc, file_name: str) -> Iterator[str]:
+        """按文档顺序逐个生成段落和表格的格式化文本"""
+        processed_elements = 0
+        try:
             paragraphs = list(doc.paragraphs)
             tables = list(doc.tables)
             p_index = 0
             t_index = 0
             
-            total_elements = len(list(doc.element.body))
-            processed_elements = 0
+            # 只统计段落和表格，直接由已解析的列表得出总数，无需额外遍历文档树
+            total_elements = len(paragraphs) + len(tables)
             table_count = 0
             
-            for element in doc.element.body:
-                if element.tag.endswith('p'):  # 段落
-                    if p_index < len(paragraphs):
-                        paragraph = paragraphs[p_index]
-                        if paragraph.style and paragraph.style.name and 'heading' in paragraph.style.name.lower():
-                            content.append(self._process_heading(paragraph))
-                        else:
-                            content.append(self._process_normal_paragraph(paragraph))
-                        p_index += 1
-                elif element.tag.endswith('tbl'):  # 表格
-                    if t_index < len(tables):
-                        content.append(self._process_table(tables[t_index]))
-                        table_count += 1
-                        t_index += 1
+            # 进度日志阈值（百分比），按顺序逐个触发
+            progress_marks = (25, 50, 75)
+            next_mark = 0
+            
+            for element in doc.element.body.iterchildren():
+                tag = element.tag
+                if tag.endswith('p') and p_index < len(paragraphs):  # 段落
+                    paragraph = paragraphs[p_index]
+                    # 样式名只取一次并转小写，标题判断和级别解析共用
+                    style = paragraph.style
+                    style_name = style.name.lower() if style and style.name else ''
+                    if 'heading' in style_name:
+                        chunk = self._process_heading(paragraph, style_name)
+                    else:
+                        chunk = self._process_normal_paragraph(paragraph)
+                    p_index += 1
+                elif tag.endswith('tbl') and t_index < len(tables):  # 表格
+                    chunk = self._process_table(tables[t_index])
+                    table_count += 1
+                    t_index += 1
+                else:
+                    continue
                 
                 processed_elements += 1
+                yield chunk
+                
                 # 只在25%、50%、75%、100%时显示进度
-                progress = processed_elements / total_elements
-                if progress >= 0.25 and not hasattr(self, '_progress_25'):
-                    self.logger.info(f"处理进度: 25% (已处理{table_count}个表格)")
-                    self._progress_25 = True
-                elif progress >= 0.50 and not hasattr(self, '_progress_50'):
-                    self.logger.info(f"处理进度: 50% (已处理{table_count}个表格)")
-                    self._progress_50 = True
-                elif progress >= 0.75 and not hasattr(self, '_progress_75'):
-                    self.logger.info(f"处理进度: 75% (已处理{table_count}个表格)")
-                    self._progress_75 = True
+                if (next_mark < len(progress_marks) and
+                        processed_elements * 100 >= total_elements * progress_marks[next_mark]):
+                    self.logger.info(f"处理进度: {progress_marks[next_mark]}% (已处理{table_count}个表格)")
+                    next_mark += 1
                 elif processed_elements == total_elements:
                     self.logger.info(f"处理完成: 共{total_elements}个元素，{table_count}个表格")
-                    # 清理进度标记
-                    for attr in ['_progress_25', '_progress_50', '_progress_75']:
-                        if hasattr(self, attr):
-                            delattr(self, attr)
             
-            return ''.join(content)
+        except Exception as e:
+            # 已生成部分内容时，损坏的内部引用只结束迭代而不视为失败
+            if self._report_extract_error(e, file_name, processed_elements):
+                return
+            raise
+    
+    def _report_extract_error(self, error: Exception, file_name: str, extracted: int) -> bool:
+        """记录提取过程中的异常
+        
+        Args:
+            error: 捕获的异常
+            file_name: 文件名
+            extracted: 已生成的元素数量
             
-        except FileNotFoundError:
+        Returns:
+            是否保留已提取的部分内容
+        """
+        if isinstance(error, FileNotFoundError):
             self.logger.error(f"文件不存在: {file_name}")
-            raise
-        except KeyError as e:
+            return False
+        if isinstance(error, KeyError):
             # 处理docx内部损坏的引用（如断开的书签链接）
-            error_msg = str(e)
+            error_msg = str(error)
             if 'word/' in error_msg and 'bookmark' in error_msg.lower():
                 self.logger.warning(f"文件包含损坏的书签引用，已跳过: {error_msg}")
             else:
                 self.logger.warning(f"文件包含损坏的内部引用，已跳过: {error_msg}")
             # 返回已处理的内容，而非完全失败
-            if content:
-                self.logger.info(f"已提取部分内容: {len(content)}个元素")
-                return ''.join(content)
-            raise
-        except Exception as e:
-            self.logger.error(f"处理失败: {file_name} - {str(e)}")
-            raise
+            if extracted:
+                self.logger.info(f"已提取部分内容: {extracted}个元素")
+                return True
+            return False
+        self.logger.error(f"处理失败: {file_name} - {str(error)}")
+        return False
+
+
+def _iter_docx(root: str, recursive: bool = True,
+               visited_dirs: Optional[List[Tuple[str, int]]] = None) -> Iterator[str]:
+    """基于 os.scandir 遍历目录，逐个产出DOCX文件路径（跳过Word临时文件 ~$*）
+    
+    Args:
+        root: 起始目录
+        recursive: 是否进入子目录
+        visited_dirs: 不为空时，把遍历过的每个目录及其列出之前的mtime（st_mtime_ns）追加到该列表
+        
+    Returns:
+        DOCX文件路径迭代器
+    """
+    stack = [root]
+    while stack:
+        dir_path = stack.pop()
+        if visited_dirs is not None:
+            # 在列出目录之前读取mtime，列出期间目录发生的变化会体现为之后的mtime不一致；
+            # 无法读取mtime时记为-1，保证下次比较时判定为已变化
+            try:
+                mtime = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                mtime = -1
+            visited_dirs.append((dir_path, mtime))
+        # 无权限等原因无法读取的目录只跳过该目录，不中断整个扫描
+        try:
+            it = os.scandir(dir_path)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"无法读取目录，已跳过: {dir_path} - {str(e)}")
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if name[:2] == '~$':
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif name.lower().endswith('.docx'):
+                    yield entry.path
+
+
+def find_docx_files(input_path: str, recursive: bool = True,
+                    visited_dirs: Optional[List[Tuple[str, int]]] = None) -> List[str]:
+    """查找DOCX文件
+    
+    Args:
+        input_path: 输入目录；也可以直接指定单个DOCX文件（此时不做临时文件过滤）
+        recursive: 是否递归搜索子目录
+        visited_dirs: 不为空时，把遍历过的每个目录及其列出之前的mtime追加到该列表
+        
+    Returns:
+        DOCX文件路径列表
+        
+    Raises:
+        FileNotFoundError: 路径不存在
+    """
+    st = os.stat(input_path)
+    if stat.S_ISREG(st.st_mode):
+        return [input_path] if input_path.lower().endswith('.docx') else []
+    return list(_iter_docx(input_path, recursive, visited_dirs))
+
+
+# 批量处理子进程内复用的提取器实例（由 init_worker 在进程启动时创建）
+_worker_extractor: Optional[DocumentExtractor] = None
+
+
+def init_worker(log_queue: Optional[Any] = None) -> None:
+    """初始化批量处理子进程，创建该进程内复用的提取器（使用默认格式，与界面的单文件处理一致）
+    
+    Args:
+        log_queue: 可跨进程传递的队列（如multiprocessing.Queue），不为空时子进程的日志经该队列转发给主进程
+    """
+    global _worker_extractor
+    if log_queue is not None:
+        logger = logging.getLogger()
+        logger.setLevel(logging.INFO)
+        logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    _worker_extractor = DocumentExtractor()
+
+
+def process_single_file(input_file: str, extractor: Optional[DocumentExtractor] = None) -> Tuple[bool, Union[bytes, str]]:
+    """提取单个DOCX文件内容（模块级函数，可在批量处理的子进程中执行）
+    
+    成功时内容已转换为系统换行符并编码为UTF-8，可直接写入文件；在子进程中执行时
+    传回主进程的是字节串，序列化开销小于字符串。
+    
+    Args:
+        input_file: DOCX文件路径
+        extractor: 使用的提取器；为空时使用 init_worker 创建的进程内实例
+        
+    Returns:
+        (是否成功, 编码后的输出内容或错误信息)
+    """
+    if extractor is None:
+        if _worker_extractor is None:
+            init_worker()
+        extractor = _worker_extractor
+    try:
+        content = extractor.extract_content(input_file)
+    except Exception as e:
+        return False, str(e)
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return True, content.encode('utf-8')
@@ -3,13 +3,18 @@
 
 from docx import Document
 import os
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Optional
 import logging
 import re
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 import threading
 import sys
+import multiprocessing
+from collections import deque
+from functools import lru_cache
+from itertools import accumulate
+from bisect import bisect_left
 
 # 版本信息
 try:
@@ -37,12 +42,55 @@ CELL_PADDING = 2           # 单元格内容两侧的空白padding总和
 LONG_TEXT_THRESHOLD = 25    # 判定为长文本的宽度阈值（字符数）
 CELL_LEFT_PADDING = 1      # 单元格左侧padding（字符数）
 NEWLINE_THRESHOLD = 2      # 触发列宽加倍的换行次数阈值
+CELL_LEFT_PAD = ' ' * CELL_LEFT_PADDING  # 单元格左侧padding字符串
 
 # 添加新的常量定义
 BASE_COLUMN_WIDTH = 15  # 基础列宽
 LEVEL_2_MULTIPLIER = 2  # Level 2 宽度倍数
 LEVEL_3_MULTIPLIER = 3  # Level 3 宽度倍数
 
+# 列宽等级：内容宽度不超过 COLUMN_WIDTH_THRESHOLDS[i] 时取 COLUMN_LEVEL_WIDTHS[i]，超过全部阈值时取最高等级
+COLUMN_WIDTH_THRESHOLDS = (BASE_COLUMN_WIDTH,
+                           BASE_COLUMN_WIDTH * LEVEL_2_MULTIPLIER,
+                           BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER)
+COLUMN_LEVEL_WIDTHS = COLUMN_WIDTH_THRESHOLDS + (BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER,)
+
+# 英文单词：连续的ASCII非空白字符，换行时不可拆分
+_ASCII_WORD_RE = re.compile(r'[^\s\x80-\U0010ffff]+')
+_ASCII_WORD_CHARS = ''.join(chr(c) for c in range(UNICODE_BOUNDARY + 1) if not chr(c).isspace())
+
+# 需要清理的文本：存在行首空白、行尾空白或空行
+_DIRTY_RE = re.compile(r'(?m)(^\s)|(\s$)|\n\s*\n')
+
+@lru_cache(maxsize=4096)
+def _string_width(text: str) -> int:
+    """计算字符串的显示宽度（带缓存，表格中重复出现的表头、单位等文本直接命中）"""
+    # 按ASCII编码时忽略的字符即为双宽字符（码点大于127），宽度计算全部在C层完成
+    return DOUBLE_CHAR_WIDTH * len(text) - len(text.encode('ascii', 'ignore'))
+
+@lru_cache(maxsize=None)
+def _heading_style(style_name: str) -> Tuple[bool, Optional[int]]:
+    """
+    解析段落样式名（按样式名缓存，文档中的样式种类很少）
+    
+    Args:
+        style_name: 段落样式名
+        
+    Returns:
+        Tuple[bool, Optional[int]]: (是否为标题样式, 标题级别（无法解析时为None）)
+    """
+    level = style_name.lower()
+    if 'heading' not in level:
+        return False, None
+    try:
+        return True, int(level[-1])
+    except ValueError:
+        return True, None
+
+def _is_word_char(char: str) -> bool:
+    """判断字符是否属于英文单词（ASCII非空白字符），换行时单词不可拆分"""
+    return char <= '\x7f' and not char.isspace()
+
 class DocxExtractor:
     """DOCX文本提取器类，用于提取Word文档中的文本和表格内容，保持原文档的结构和位置关系"""
     
@@ -72,7 +120,9 @@ class DocxExtractor:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
         
-        # 清除已有的处理器
+        # 清除已有的处理器（关闭后GUI处理器的定时刷新随之停止）
+        for handler in self.logger.handlers:
+            handler.close()
         self.logger.handlers.clear()
         
         # 添加控制台处理器
@@ -82,18 +132,6 @@ class DocxExtractor:
         if gui_handler:
             self.logger.addHandler(gui_handler)
     
-    def _get_char_width(self, char: str) -> int:
-        """
-        获取字符的显示宽度
-        
-        Args:
-            char: 单个字符
-        
-        Returns:
-            int: 字符的显示宽度
-        """
-        return DOUBLE_CHAR_WIDTH if ord(char) > UNICODE_BOUNDARY else SINGLE_CHAR_WIDTH
-    
     def _get_string_width(self, text: str) -> int:
         """
         获取字符串的显示宽度
@@ -104,7 +142,7 @@ class DocxExtractor:
         Returns:
             int: 字符串的显示宽度
         """
-        return sum(self._get_char_width(char) for char in str(text))
+        return _string_width(str(text))
     
     def _clean_text(self, text: str) -> str:
         """
@@ -118,6 +156,9 @@ class DocxExtractor:
         """
         if not text:
             return ""
+        # 已经干净的文本（没有行首/行尾空白和空行）原样返回
+        if not _DIRTY_RE.search(text):
+            return text
         
         # 保留换行符，但删除每行开头和结尾的空白字符
         lines = text.split('\n')
@@ -142,12 +183,13 @@ class DocxExtractor:
         
         return '\n'.join(result_lines)
     
-    def _process_heading(self, paragraph) -> str:
+    def _process_heading(self, paragraph, level_num: Optional[int]) -> str:
         """
         处理标题段落
         
         Args:
             paragraph: 段落对象
+            level_num: 标题级别，无法从样式名解析时为None
             
         Returns:
             str: 格式化的标题文本
@@ -160,15 +202,11 @@ class DocxExtractor:
             return ""
             
         # 根据标题级别添加不同数量的#
-        level = paragraph.style.name.lower()
-        if 'heading' in level:
-            try:
-                level_num = int(level[-1])
-                result = f"{'#' * level_num} {text}\n"
-                self.logger.debug(f"处理标题完成，级别: {level_num}, 内容: {text[:50]}...")
-                return result
-            except ValueError:
-                self.logger.warning(f"无法解析标题级别: {level}")
+        if level_num is not None:
+            result = f"{'#' * level_num} {text}\n"
+            self.logger.debug(f"处理标题完成，级别: {level_num}, 内容: {text[:50]}...")
+            return result
+        self.logger.warning(f"无法解析标题级别: {paragraph.style.name.lower()}")
                 
         result = f"# {text}\n"
         self.logger.debug(f"处理默认标题完成: {text[:50]}...")
@@ -194,59 +232,54 @@ class DocxExtractor:
         # 实际可用宽度
         available_width = max_width - indent_width
         
-        result_lines = []
-        current_line = []
-        current_width = 0
-        
-        # 分词处理，保持英文单词的完整性
-        words = []
-        temp_word = ""
-        
-        for char in text:
-            if char.isspace():
-                if temp_word:
-                    words.append(temp_word)
-                    temp_word = ""
-                words.append(char)
-            else:
-                # 对于中文字符，单独作为一个词
-                if ord(char) > 127:
-                    if temp_word:
-                        words.append(temp_word)
-                        temp_word = ""
-                    words.append(char)
-                else:
-                    temp_word += char
-        if temp_word:
-            words.append(temp_word)
-            
-        # 按宽度分行
-        for word in words:
-            word_width = self._get_string_width(word)
-            
-            # 如果当前行是空的，直接添加
-            if not current_line:
-                current_line.append(word)
-                current_width = word_width
-                continue
-                
-            # 检查添加这个词是否会超出宽度
-            if current_width + word_width <= available_width:
-                current_line.append(word)
-                current_width += word_width
-            else:
-                # 当前行已满，开始新行
-                result_lines.append("".join(current_line))
-                current_line = [word]
-                current_width = word_width
-                
-        # 处理最后一行
-        if current_line:
-            result_lines.append("".join(current_line))
+        # 分词并按宽度分行
+        result_lines = self._wrap_line(text, available_width)
             
         # 添加缩进并连接所有行
         return "\n".join(indent + line.strip() for line in result_lines)
         
+    def _wrap_line(self, text: str, available_width: int) -> List[str]:
+        """
+        对文本按显示宽度贪心分行
+        
+        英文单词（连续的ASCII非空白字符）保持完整，空白字符和非ASCII字符各自单独成词；
+        每行尽可能多地容纳词且宽度不超过 available_width，单个超宽的词独占一行。
+        每行先按可用宽度估算结束位置并整段测量宽度，超出时按超出量成批回退，
+        再退回到最近的词边界，无需逐字符累加宽度。
+        
+        Args:
+            text: 待分行的文本
+            available_width: 每行可用宽度
+            
+        Returns:
+            List[str]: 分行后的文本列表
+        """
+        lines = []
+        text_len = len(text)
+        start = 0
+        
+        while start < text_len:
+            # 每个字符宽度至少为1，先取 available_width 个字符作为估计的行尾
+            end = min(text_len, start + max(available_width, 0))
+            width = self._get_string_width(text[start:end])
+            # 超出时每次回退超出量的一半（向上取整）个字符，双宽字符不会被多退
+            while end > start and width > available_width:
+                end -= (width - available_width + 1) // 2
+                width = self._get_string_width(text[start:end])
+            
+            # 行尾落在英文单词内部时退回到该单词开头（rstrip 在C层去掉行尾的单词片段）
+            if start < end < text_len and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+                end = start + len(text[start:end].rstrip(_ASCII_WORD_CHARS))
+            
+            # 行首的词本身就超宽：该词独占一行，英文单词由正则一次匹配到词尾
+            if end == start:
+                word = _ASCII_WORD_RE.match(text, start)
+                end = word.end() if word else start + 1
+            
+            lines.append(text[start:end])
+            start = end
+        return lines
+    
     def _process_normal_paragraph(self, paragraph) -> str:
         """
         处理普通段落，实现基于视觉宽度的自动换行
@@ -265,100 +298,96 @@ class DocxExtractor:
             
         text = paragraph.text.strip()
         
-        if paragraph.style and 'heading' in paragraph.style.name.lower():
-            try:
-                level = int(paragraph.style.name.lower()[-1])
-                prefix = HEADING_PREFIX * level + ' '
-                result = f"{prefix}{text}\n\n"
-                self.logger.debug(f"处理带样式段落完成，样式: {paragraph.style.name}")
-                return result
-            except ValueError:
-                prefix = HEADING_PREFIX + ' '
-                self.logger.warning(f"无法解析段落样式级别: {paragraph.style.name}")
-                result = f"{prefix}{text}\n\n"
-                return result
-            
         wrapped_text = self._wrap_text_by_width(text, max_width=100, indent=DEFAULT_INDENT)
         self.logger.debug(f"处理普通段落完成，长度: {len(text)}")
         return wrapped_text + "\n\n"
     
-    def _get_merged_cell_info(self, cell, row_idx: int, col_idx: int) -> Tuple[int, int]:
+    def _read_cell_props(self, cell) -> Tuple[Optional[str], int, str]:
         """
-        获取单元格的合并信息，通过多个条件判断是否应该合并
+        读取单元格的合并属性和文本（只读取已有的tcPr，不会修改文档XML）
         
         Args:
             cell: 单元格对象
-            row_idx: 行索引
-            col_idx: 列索引
             
         Returns:
-            Tuple[int, int]: (垂直合并跨度, 水平合并跨度)
+            Tuple[Optional[str], int, str]: (vMerge取值（无纵向合并时为None）, 水平合并跨度, 单元格原始文本)
+        """
+        tc_pr = cell._tc.tcPr
+        vmerge = hmerge = None
+        if tc_pr is not None:
+            vmerge = tc_pr.first_child_found_in("w:vMerge")
+            hmerge = tc_pr.first_child_found_in("w:gridSpan")
+        return (vmerge.val if vmerge is not None else None,
+                int(hmerge.val) if hmerge is not None else 1,
+                cell.text)
+    
+    def _compute_vspans(self, cell_props: Dict[Tuple[int, int], Tuple[Optional[str], int, str]],
+                        row_lengths: List[int]) -> Dict[Tuple[int, int], int]:
         """
-        vmerge = cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge")
-        hmerge = cell._tc.get_or_add_tcPr().first_child_found_in("w:gridSpan")
+        一次自上而下的扫描计算所有纵向合并起始单元格的合并行数
         
-        vspan = 1
-        hspan = int(hmerge.val) if hmerge is not None else 1
+        每列维护一个未结束的合并（起始行, 起始单元格文本），后续行的单元格满足合并条件时
+        并入该合并，否则结束它；遇到新的起始单元格时开始新的合并。
         
-        # 处理垂直合并
-        if vmerge is not None:
-            current_text = cell.text.strip()
+        Args:
+            cell_props: (行索引, 列索引) -> (vMerge取值, 水平合并跨度, 原始文本) 的单元格属性缓存
+            row_lengths: 每行的单元格数量
             
-            if vmerge.val == "restart":  # 合并的起始单元格
-                # 找出合并的行数
-                current_row = row_idx + 1
-                while current_row < len(self.current_table.rows):
-                    next_cell = self.current_table.rows[current_row].cells[col_idx]
-                    next_vmerge = next_cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge")
-                    next_text = next_cell.text.strip()
-                    
+        Returns:
+            Dict[Tuple[int, int], int]: (行索引, 列索引) -> 垂直合并跨度，仅包含合并起始单元格
+        """
+        vspans = {}
+        open_merges = {}  # 列索引 -> (起始行索引, 起始单元格去除空白后的文本)
+        
+        for row_idx, row_length in enumerate(row_lengths):
+            # 本行缺少的列上的合并到此结束
+            for col_idx in [c for c in open_merges if c >= row_length]:
+                del open_merges[col_idx]
+            
+            for col_idx in range(row_length):
+                vmerge, _, text = cell_props[(row_idx, col_idx)]
+                next_text = text.strip()
+                
+                open_merge = open_merges.get(col_idx)
+                if open_merge is not None:
+                    start_row, current_text = open_merge
                     # 判断是否应该合并的条件：
-                    # 1. 下一个单元格有vMerge属性
+                    # 1. 单元格有vMerge属性
                     # 2. 不是新的合并起始点
-                    # 3. 如果当前单元格有内容，则要求下一个单元格内容相同或为空
-                    # 4. 如果当前单元格为空，则不要求下一个单元格内容
-                    should_merge = (next_vmerge is not None and 
-                                  (next_vmerge.val != "restart") and
-                                  (not current_text or 
-                                   not next_text or 
-                                   current_text == next_text))
-                    
-                    if not should_merge:
-                        break
-                        
-                    vspan += 1
-                    current_row += 1
-                    
-            else:  # 被合并的单元格
-                # 向上查找合并的起始单元格
-                current_row = row_idx - 1
-                found_start = False
-                
-                while current_row >= 0:
-                    prev_cell = self.current_table.rows[current_row].cells[col_idx]
-                    prev_vmerge = prev_cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge")
-                    prev_text = prev_cell.text.strip()
-                    
-                    # 判断是否是合并的起始点：
-                    # 1. 上一个单元格有vMerge属性且是restart
-                    # 2. 如果当前单元格有内容，则要求与起始单元格内容相同
-                    # 3. 如果当前单元格为空，则不要求起始单元格内容
-                    if (prev_vmerge is not None and 
-                        prev_vmerge.val == "restart" and
-                        (not current_text or 
-                         not prev_text or 
-                         current_text == prev_text)):
-                        found_start = True
-                        vspan = 0  # 标记为被合并的单元格
-                        break
-                        
-                    current_row -= 1
-                    
-                # 如果向上没有找到合适的起始点，则不进行合并
-                if not found_start:
-                    vspan = 1
+                    # 3. 如果起始单元格有内容，则要求该单元格内容相同或为空
+                    # 4. 如果起始单元格为空，则不要求该单元格内容
+                    if (vmerge is not None and vmerge != "restart" and
+                            (not current_text or not next_text or current_text == next_text)):
+                        vspans[(start_row, col_idx)] += 1
+                        continue
+                    del open_merges[col_idx]
                 
-        return vspan, hspan
+                if vmerge == "restart":
+                    vspans[(row_idx, col_idx)] = 1
+                    open_merges[col_idx] = (row_idx, next_text)
+        
+        return vspans
+    
+    def _get_merged_cell_info(self, cell_props: Dict[Tuple[int, int], Tuple[Optional[str], int, str]],
+                              vspans: Dict[Tuple[int, int], int],
+                              row_idx: int, col_idx: int) -> Tuple[int, int]:
+        """
+        获取单元格的合并信息
+        
+        只读取调用方传入的单元格属性缓存和预先计算的纵向合并跨度，不依赖实例状态；
+        纵向合并的续行单元格（vMerge=continue）由其起始单元格统一计算，调用方应直接跳过。
+        
+        Args:
+            cell_props: (行索引, 列索引) -> (vMerge取值, 水平合并跨度, 原始文本) 的单元格属性缓存
+            vspans: _compute_vspans 计算出的合并起始单元格的垂直合并跨度
+            row_idx: 行索引
+            col_idx: 列索引
+            
+        Returns:
+            Tuple[int, int]: (垂直合并跨度, 水平合并跨度)
+        """
+        _, hspan, _ = cell_props[(row_idx, col_idx)]
+        return vspans.get((row_idx, col_idx), 1), hspan
         
     def _process_cell_content(self, cell_text: str, total_width: int) -> List[str]:
         """
@@ -385,45 +414,7 @@ class DocxExtractor:
                 wrapped_lines.append('')
                 continue
             
-            current_line = []
-            current_width = 0
-            
-            # 分词处理
-            words = []
-            temp_word = ""
-            
-            for char in line:
-                if char.isspace():
-                    if temp_word:
-                        words.append(temp_word)
-                        temp_word = ""
-                    words.append(char)
-                else:
-                    if ord(char) > 127:  # 中文字符
-                        if temp_word:
-                            words.append(temp_word)
-                            temp_word = ""
-                        words.append(char)
-                    else:
-                        temp_word += char
-            if temp_word:
-                words.append(temp_word)
-            
-            # 组织行
-            for word in words:
-                word_width = self._get_string_width(word)
-                
-                if current_width + word_width <= available_width:
-                    current_line.append(word)
-                    current_width += word_width
-                else:
-                    if current_line:
-                        wrapped_lines.append(''.join(current_line))
-                    current_line = [word]
-                    current_width = word_width
-            
-            if current_line:
-                wrapped_lines.append(''.join(current_line))
+            wrapped_lines.extend(self._wrap_line(line, available_width))
         
         return wrapped_lines if wrapped_lines else ['']
         
@@ -440,9 +431,6 @@ class DocxExtractor:
         """
         self.logger.debug("开始计算列宽...")
         
-        # 初始化列宽数组
-        col_widths = [0] * max_cols
-        
         # 第一步:计算每列中最大内容宽度
         max_content_widths = [0] * max_cols
         for row_data in table_data:
@@ -452,42 +440,51 @@ class DocxExtractor:
                     max_content_widths[col_idx] = max(max_content_widths[col_idx], content_width)
         
         # 第二步:根据内宽度确定每列等级
-        for col_idx in range(max_cols):
-            max_width = max_content_widths[col_idx]
-            if max_width <= BASE_COLUMN_WIDTH:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH
-            elif max_width <= BASE_COLUMN_WIDTH * LEVEL_2_MULTIPLIER:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH * LEVEL_2_MULTIPLIER
-            elif max_width <= BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER
-            else:
-                col_widths[col_idx] = BASE_COLUMN_WIDTH * LEVEL_3_MULTIPLIER
+        col_widths = [COLUMN_LEVEL_WIDTHS[bisect_left(COLUMN_WIDTH_THRESHOLDS, max_width)]
+                      for max_width in max_content_widths]
             
         # 第三步:处理合并单元格
+        col_prefix = list(accumulate(col_widths, initial=0))
         for row_data in table_data:
             for col_idx, cell_data in enumerate(row_data):
                 if cell_data['hspan'] > 1:
                     # 计算合并单元格占用的总宽度
-                    total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + cell_data['hspan'], len(col_widths))))
+                    end = min(col_idx + cell_data['hspan'], max_cols)
+                    total_width = col_prefix[end] - col_prefix[col_idx]
                     # 更新cell_data中的实际可用宽度信息
                     cell_data['available_width'] = total_width - CELL_PADDING
         
         self.logger.debug(f"列宽计算完成: {col_widths}")
         return col_widths
         
-    def _format_table_row(self, row_data: List[Dict], col_widths: List[int], line_idx: int) -> str:
+    def _span_width(self, col_prefix: List[int], col_idx: int, hspan: int) -> int:
+        """
+        计算从 col_idx 列起横跨 hspan 列的总宽度（含被合并的列分隔符）
+        
+        Args:
+            col_prefix: 列宽前缀和，col_prefix[i] 为前 i 列宽度之和
+            col_idx: 起始列索引
+            hspan: 水平合并跨度
+            
+        Returns:
+            int: 合并后的总宽度
+        """
+        end = max(col_idx, min(col_idx + hspan, len(col_prefix) - 1))
+        return col_prefix[end] - col_prefix[col_idx] + (hspan - 1)
+    
+    def _format_table_row(self, row_data: List[Dict], col_prefix: List[int], line_idx: int) -> str:
         """
         格式化表格行，支持垂直合并单元格
         
         Args:
             row_data: 行数据
-            col_widths: 列宽列表
+            col_prefix: 列宽前缀和
             line_idx: 行索引
             
         Returns:
             str: 格式化后的行字符串
         """
-        row_content = '|'
+        parts = ['|']
         col_idx = 0
         
         while col_idx < len(row_data):
@@ -495,7 +492,7 @@ class DocxExtractor:
             hspan = cell_data['hspan']
             
             # 计算单元格总宽度
-            total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + hspan, len(col_widths)))) + (hspan - 1)
+            total_width = self._span_width(col_prefix, col_idx, hspan)
             
             # 获取单元格文本
             if cell_data['vspan'] == 0:  # 被合并的单元格
@@ -505,41 +502,49 @@ class DocxExtractor:
             
             # 计算填充
             content_width = self._get_string_width(cell_text)
-            left_padding = CELL_LEFT_PADDING
-            right_padding = total_width - content_width - left_padding
+            right_padding = total_width - content_width - CELL_LEFT_PADDING
             
             # 添加单元格内容
-            row_content += ' ' * left_padding + cell_text + ' ' * right_padding + '|'
+            parts.extend((CELL_LEFT_PAD, cell_text, ' ' * right_padding, '|'))
             
             col_idx += hspan
         
-        return row_content
+        return ''.join(parts)
         
-    def _collect_table_data(self, table) -> Tuple[List[List[Dict]], int]:
+    def _collect_table_data(self, rows_cells: List[List]) -> Tuple[List[List[Dict]], int]:
         """
         收集表格数据和合并单元格信息
         
         Args:
-            table: 表格对象
+            rows_cells: 每行的单元格列表（由调用方从 table.rows 一次性取出）
             
         Returns:
             Tuple[List[List[Dict]], int]: (表格数据, 最大列数)
         """
         self.logger.debug("开始收集表格数据...")
-        max_cols = max(len(row.cells) for row in table.rows)
+        row_lengths = [len(cells) for cells in rows_cells]
+        max_cols = max(row_lengths)
         table_data = []
         
-        for row_idx, row in enumerate(table.rows):
+        # 一次性读取所有单元格的合并属性和文本，按 (行索引, 列索引) 缓存，合并计算时不再访问XML
+        cell_props = {}
+        for row_idx, cells in enumerate(rows_cells):
+            for col_idx, cell in enumerate(cells):
+                cell_props[(row_idx, col_idx)] = self._read_cell_props(cell)
+        vspans = self._compute_vspans(cell_props, row_lengths)
+        
+        for row_idx, row_length in enumerate(row_lengths):
             row_data = []
-            for col_idx, cell in enumerate(row.cells):
-                vspan, hspan = self._get_merged_cell_info(cell, row_idx, col_idx)
-                
-                if cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge") is not None and \
-                   cell._tc.get_or_add_tcPr().first_child_found_in("w:vMerge").val != "restart":
+            for col_idx in range(row_length):
+                vmerge, _, text = cell_props[(row_idx, col_idx)]
+                # 纵向合并的续行单元格由起始单元格统一处理
+                if vmerge is not None and vmerge != "restart":
                     continue
                 
+                vspan, hspan = self._get_merged_cell_info(cell_props, vspans, row_idx, col_idx)
+                
                 # 清理并保持单元格内的换行
-                cell_text = self._clean_text(cell.text)
+                cell_text = self._clean_text(text)
                 original_lines = cell_text.split('\n')
                 line_widths = [self._get_string_width(line) for line in original_lines]
                 max_line_width = max(line_widths) if line_widths else 0
@@ -572,29 +577,37 @@ class DocxExtractor:
         self.logger.debug(f"表格数据收集完成，共 {len(table_data)} 行")
         return table_data, max_cols
 
-    def _process_cell_wrapping(self, table_data: List[List[Dict]], col_widths: List[int]):
+    def _process_cell_wrapping(self, table_data: List[List[Dict]], col_prefix: List[int]):
         """
         处理所有单元格的文本换行，包括纵向合并单元格
         
         Args:
             table_data: 表格数据
-            col_widths: 列宽列表
+            col_prefix: 列宽前缀和
         """
         self.logger.debug("开始处理单元格文本换行...")
         
-        # 第一遍：处理垂直合并单元格的文本
+        # 自上而下一遍处理：纵向合并单元格只会覆盖其下方的行，处理到某行时该行已标记完毕
         for row_idx, row_data in enumerate(table_data):
             for col_idx, cell_data in enumerate(row_data):
-                if cell_data['vspan'] > 1:  # 处理垂直合并单元格
+                vspan = cell_data['vspan']
+                if vspan == 1:  # 普通单元格
+                    if not cell_data['text']:
+                        cell_data['lines'] = ['']  # 确保空单元格也有一个空行
+                        continue
+                    
+                    total_width = self._span_width(col_prefix, col_idx, cell_data['hspan'])
+                    cell_data['lines'] = self._process_cell_content(cell_data['text'], total_width)
+                elif vspan > 1:  # 垂直合并单元格
                     # 计算水平方向的总宽度
-                    h_total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + cell_data['hspan'], len(col_widths)))) + (cell_data['hspan'] - 1)
+                    h_total_width = self._span_width(col_prefix, col_idx, cell_data['hspan'])
                     
                     # 处理合并单元格的文本换行
                     if cell_data['text']:
                         cell_data['lines'] = self._process_cell_content(cell_data['text'], h_total_width)
                         
                     # 标记被合并的单元格
-                    for v_idx in range(row_idx + 1, min(row_idx + cell_data['vspan'], len(table_data))):
+                    for v_idx in range(row_idx + 1, min(row_idx + vspan, len(table_data))):
                         table_data[v_idx][col_idx] = {
                             'text': '',
                             'lines': [''],  # 使用空字符串而不是空列表
@@ -605,26 +618,17 @@ class DocxExtractor:
                             'merged_from': (row_idx, col_idx)  # 添加合并源信息
                         }
         
-        # 第二遍：处理普通单元格
-        for row_idx, row_data in enumerate(table_data):
-            for col_idx, cell_data in enumerate(row_data):
-                if cell_data['vspan'] == 1:  # 只处理非垂直合并单元格
-                    if not cell_data['text']:
-                        cell_data['lines'] = ['']  # 确保空单元格也有一个空行
-                        continue
-                    
-                    total_width = sum(col_widths[i] for i in range(col_idx, min(col_idx + cell_data['hspan'], len(col_widths)))) + (cell_data['hspan'] - 1)
-                    cell_data['lines'] = self._process_cell_content(cell_data['text'], total_width)
-        
         self.logger.debug("单元格文本换行处理完成")
 
-    def _generate_table_string(self, table_data: List[List[Dict]], col_widths: List[int]) -> str:
+    def _generate_table_string(self, table_data: List[List[Dict]], col_widths: List[int],
+                               col_prefix: List[int]) -> str:
         """
         生成最终的表格字符串，支持垂直合并单元格
         
         Args:
             table_data: 表格数据
             col_widths: 列宽列表
+            col_prefix: 列宽前缀和
             
         Returns:
             str: 格式化的表格字符串
@@ -652,8 +656,7 @@ class DocxExtractor:
                     if not cell_data['lines']:
                         cell_data['lines'] = ['']
                     # 补齐行数
-                    while len(cell_data['lines']) < max_lines:
-                        cell_data['lines'].append('')
+                    cell_data['lines'].extend([''] * (max_lines - len(cell_data['lines'])))
             
             # 添加分隔线
             # 只在以下情况添加分隔线：
@@ -667,7 +670,7 @@ class DocxExtractor:
             
             # 处理多行单元格
             for line_idx in range(max_lines):
-                result.append(self._format_table_row(row_data, col_widths, line_idx))
+                result.append(self._format_table_row(row_data, col_prefix, line_idx))
         
         # 添加最后一行分隔线
         result.append(separator)
@@ -687,25 +690,28 @@ class DocxExtractor:
             str: 格式化的表格文本
         """
         try:
-            self.logger.info(f"处理表格: {len(table.rows)}行 x {len(table.rows[0].cells) if table.rows else 0}列")
+            # python-docx 每次访问 table.rows / row.cells 都会重新构建对象，这里只取一次
+            rows_cells = [list(row.cells) for row in table.rows]
+            self.logger.info(f"处理表格: {len(rows_cells)}行 x {len(rows_cells[0]) if rows_cells else 0}列")
             
-            if not table.rows:
+            if not rows_cells:
                 self.logger.warning("表格为空")
                 return "\n"
-                
-            self.current_table = table  # 存储当前处理的表格对象
             
             # 1. 收集表格数据
-            table_data, max_cols = self._collect_table_data(table)
+            table_data, max_cols = self._collect_table_data(rows_cells)
             
             # 2. 计算列宽
             col_widths = self._calculate_column_widths(table_data, max_cols)
             
+            # 列宽前缀和：任意连续列的总宽度都可直接相减求得
+            col_prefix = list(accumulate(col_widths, initial=0))
+            
             # 3. 处理文本换行
-            self._process_cell_wrapping(table_data, col_widths)
+            self._process_cell_wrapping(table_data, col_prefix)
             
             # 4. 生成表格字符串
-            result = self._generate_table_string(table_data, col_widths)
+            result = self._generate_table_string(table_data, col_widths, col_prefix)
             self.logger.info("表格处理完成")
             
             return result
@@ -715,12 +721,18 @@ class DocxExtractor:
             return "【表格处理失败】\n"
     
     def extract_and_save(self):
-        """提取DOCX内容并保存到文本文件，保持原文档结构"""
+        """提取DOCX内容并保存到文本文件，保持原文档结构
+        
+        每个段落/表格处理完成后立即写入临时文件（输出路径加.tmp后缀），不在内存中保留整篇文档的内容，
+        处理完成后再替换为输出文件；处理失败时删除临时文件，已有的输出文件保持不变
+        （损坏的内部引用导致的中断除外，此时保留已提取的部分）。
+        """
+        written_elements = 0   # 已写入输出文件的元素数量
+        output_opened = False
         try:
             self.logger.info(f"开始处理DOCX文件: {self.docx_path}")
             
             doc = Document(self.docx_path)
-            content = []
             
             # 获取所有段落和表格
             paragraphs = list(doc.paragraphs)
@@ -732,33 +744,39 @@ class DocxExtractor:
             total_elements = len(list(doc.element.body))
             processed_elements = 0
             
-            for element in doc.element.body:
-                if element.tag.endswith('p'):  # 段落
-                    if p_index < len(paragraphs):
-                        paragraph = paragraphs[p_index]
-                        if paragraph.style and paragraph.style.name and 'heading' in paragraph.style.name.lower():
-                            content.append(self._process_heading(paragraph))
-                        else:
-                            content.append(self._process_normal_paragraph(paragraph))
-                        p_index += 1
-                elif element.tag.endswith('tbl'):  # 表格
-                    if t_index < len(tables):
-                        content.append(self._process_table(tables[t_index]))
-                        t_index += 1
-                
-                processed_elements += 1
-                if processed_elements % 10 == 0 or processed_elements == total_elements:
-                    self.logger.info(f"处理进度: {processed_elements}/{total_elements} ({processed_elements/total_elements*100:.1f}%)")
-                
-            # 保存到文本文件
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                f.write(''.join(content))
+            # 边处理边写入临时文件（1MB写缓冲）
+            with open(self.output_path + '.tmp', 'w', encoding='utf-8', buffering=1 << 20) as f:
+                output_opened = True
+                for element in doc.element.body:
+                    if element.tag.endswith('p'):  # 段落
+                        if p_index < len(paragraphs):
+                            paragraph = paragraphs[p_index]
+                            style = paragraph.style
+                            is_heading, level_num = (_heading_style(style.name) if style and style.name
+                                                     else (False, None))
+                            if is_heading:
+                                f.write(self._process_heading(paragraph, level_num))
+                            else:
+                                f.write(self._process_normal_paragraph(paragraph))
+                            written_elements += 1
+                            p_index += 1
+                    elif element.tag.endswith('tbl'):  # 表格
+                        if t_index < len(tables):
+                            f.write(self._process_table(tables[t_index]))
+                            written_elements += 1
+                            t_index += 1
+                    
+                    processed_elements += 1
+                    if processed_elements % 10 == 0 or processed_elements == total_elements:
+                        self.logger.info(f"处理进度: {processed_elements}/{total_elements} ({processed_elements/total_elements*100:.1f}%)")
             
+            os.replace(self.output_path + '.tmp', self.output_path)
             self.logger.info(f"文件处理完成，已保存到: {self.output_path}")
             return True
             
         except FileNotFoundError:
             self.logger.error(f"找不到DOCX文件: {self.docx_path}")
+            self._discard_output(output_opened)
             raise
         except KeyError as e:
             # 处理docx内部损坏的引用（如断开的书签链接）
@@ -767,52 +785,78 @@ class DocxExtractor:
                 self.logger.warning(f"文件包含损坏的书签引用，已跳过: {error_msg}")
             else:
                 self.logger.warning(f"文件包含损坏的内部引用，已跳过: {error_msg}")
-            # 尝试保存已处理的内容
-            if content:
-                self.logger.info(f"已提取部分内容，正在保存...")
-                with open(self.output_path, 'w', encoding='utf-8') as f:
-                    f.write(''.join(content))
+            # 已处理的内容在写入时已保存，退出with时已刷新到磁盘
+            if written_elements:
+                os.replace(self.output_path + '.tmp', self.output_path)
                 self.logger.info(f"部分内容已保存到: {self.output_path}")
                 return True
+            self._discard_output(output_opened)
             raise
         except Exception as e:
             self.logger.error(f"处理DOCX时发生错误: {str(e)}")
+            self._discard_output(output_opened)
             raise
+    
+    def _discard_output(self, output_opened: bool) -> None:
+        """
+        删除处理失败时留下的不完整临时文件
+        
+        Args:
+            output_opened: 本次处理是否已创建临时文件
+        """
+        if not output_opened:
+            return
+        try:
+            os.remove(self.output_path + '.tmp')
+        except OSError:
+            pass
 
 class GUILogHandler(logging.Handler):
-    """GUI日志处理器，将日志输出到文本框，带缓冲机制"""
+    """GUI日志处理器，将日志输出到文本框，带缓冲机制
+    
+    emit 只把消息追加到缓冲区（可在任意线程调用），由一个固定间隔的定时器
+    在Tk主循环中统一批量写入文本框，处理器关闭后定时器在最后一次刷新后停止。
+    """
+    
+    FLUSH_INTERVAL_MS = 100      # 缓冲区刷新间隔（毫秒）
+    MAX_BUFFERED_LINES = 10000   # 缓冲区最多保留的日志条数，超出时丢弃最早的日志
     
     def __init__(self, text_widget):
         super().__init__()
         self.text_widget = text_widget
-        self.buffer = []
-        self.update_pending = False
+        self.buffer = deque(maxlen=self.MAX_BUFFERED_LINES)
+        self._buffer_lock = threading.Lock()
+        self._closed = False
+        self.text_widget.after(self.FLUSH_INTERVAL_MS, self._drain_loop)
         
     def emit(self, record):
         """输出日志记录到文本框"""
         try:
             msg = self.format(record)
-            self.buffer.append(msg + '\n')
-            
-            # 如果没有待处理的更新，安排一个
-            if not self.update_pending:
-                self.update_pending = True
-                self.text_widget.after(100, self._flush_buffer)
+            with self._buffer_lock:
+                self.buffer.append(msg + '\n')
         except Exception:
             pass
+    
+    def close(self):
+        """关闭处理器，剩余日志由下一次定时刷新写入后停止定时器"""
+        self._closed = True
+        super().close()
             
-    def _flush_buffer(self):
-        """批量更新文本框"""
+    def _drain_loop(self):
+        """定时批量更新文本框"""
         try:
-            if self.buffer:
-                # 批量插入所有缓冲的日志
+            with self._buffer_lock:
                 text = ''.join(self.buffer)
+                self.buffer.clear()
+            if text:
+                # 批量插入所有缓冲的日志
                 self.text_widget.insert(tk.END, text)
                 self.text_widget.see(tk.END)
-                self.buffer.clear()
-            self.update_pending = False
+            if not self._closed:
+                self.text_widget.after(self.FLUSH_INTERVAL_MS, self._drain_loop)
         except Exception:
-            self.update_pending = False
+            pass
 
 class DocxExtractorGUI:
     """DOCX提取器图形界面"""
@@ -968,6 +1012,42 @@ class DocxExtractorGUI:
         """运行GUI"""
         self.root.mainloop()
 
+def _extract_one(docx_path: str) -> Tuple[bool, str]:
+    """
+    在子进程中提取单个DOCX文件（模块级函数，可被pickle）
+    
+    Args:
+        docx_path: DOCX文件路径
+        
+    Returns:
+        Tuple[bool, str]: (是否成功, 输出文件路径或错误信息)
+    """
+    extractor = DocxExtractor(docx_path, auto_setup_logging=False)
+    extractor.logger = logging.getLogger(__name__)
+    try:
+        extractor.extract_and_save()
+        return True, extractor.output_path
+    except Exception as e:
+        return False, str(e)
+
+def extract_many(paths: List[str], workers: Optional[int] = None) -> List[Tuple[bool, str]]:
+    """
+    使用多进程并行提取多个DOCX文件，每个文件输出到同目录下的同名.md文件
+    
+    各文件的处理相互独立，多进程可绕开GIL按CPU核心数近似线性加速；
+    文件位于机械硬盘上时磁盘寻道可能成为瓶颈，可适当减少workers。
+    
+    Args:
+        paths: DOCX文件路径列表
+        workers: 进程数，默认为CPU核心数减1（至少为1）
+        
+    Returns:
+        List[Tuple[bool, str]]: 与paths顺序一致的 (是否成功, 输出文件路径或错误信息) 列表
+    """
+    workers = workers or max(1, (os.cpu_count() or 1) - 1)
+    with multiprocessing.Pool(min(workers, len(paths)) or 1) as pool:
+        return pool.map(_extract_one, paths)
+
 def main():
     """主函数"""
     # 检查是否有命令行参数
@@ -981,6 +1061,18 @@ def main():
         except Exception as e:
             print(f"错误: {str(e)}")
             sys.exit(1)
+    elif len(sys.argv) > 2:
+        # 命令行批量模式：多个文件并行处理
+        docx_paths = sys.argv[1:]
+        failed = 0
+        for docx_path, (success, message) in zip(docx_paths, extract_many(docx_paths)):
+            if success:
+                print(f"已保存: {message}")
+            else:
+                failed += 1
+                print(f"错误: {docx_path}: {message}")
+        if failed:
+            sys.exit(1)
     else:
         # GUI模式
         try:
@@ -988,8 +1080,9 @@ def main():
             app.run()
         except Exception as e:
             print(f"启动GUI失败: {str(e)}")
-            print("使用方法: python docx_extractor.py <docx文件路径>")
+            print("使用方法: python docx_extractor.py <docx文件路径> [<docx文件路径> ...]")
             sys.exit(1)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
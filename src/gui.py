@@ -6,22 +6,63 @@ DOCX文档提取器图形界面
 """
 
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import subprocess
 import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 import sys
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
+import tkinter.font as tkfont
 
 from config import Config
-from core import DocumentExtractor
 from src import __version__, __app_name__
 
+# 文件数达到该值时才启用进程池，文件较少时进程启动开销超过并行收益，直接在当前进程处理
+PROCESS_POOL_MIN_FILES = 4
+
+# 批量处理日志与进度的刷新间隔（毫秒），后台线程只写缓冲区，由该定时器统一更新界面
+BATCH_FLUSH_INTERVAL_MS = 100
+
+
+def _write_output(output_path: str, data: bytes) -> None:
+    """写入输出文件（所在目录需已存在）
+    
+    已编码的内容直接通过文件描述符写入，不经过文本模式的编码与缓冲。
+    
+    Args:
+        output_path: 输出文件路径
+        data: 已编码的文件内容（process_single_file 的输出）
+    """
+    view = memoryview(data)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        # 处理部分写入的情况，直到全部数据写完
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 class GUILogHandler(logging.Handler):
-    """GUI日志处理器"""
+    """GUI日志处理器
+    
+    emit 只把消息追加到缓冲区（可在任意线程调用），由构造时启动的固定间隔定时器
+    在Tk主循环中统一批量写入文本框。
+    """
+    
+    FLUSH_INTERVAL_MS = 200       # 缓冲区刷新间隔（毫秒）
+    MAX_LINES = 5000              # 文本框最多保留的日志行数，超出时删除最早的日志
+    MAX_BUFFERED_LINES = 10000    # 缓冲区最多保留的日志条数，界面未及时刷新时丢弃最早的日志
     
     def __init__(self, text_widget: tk.Text) -> None:
         """初始化GUI日志处理器
@@ -31,41 +72,55 @@ class GUILogHandler(logging.Handler):
         """
         super().__init__()
         self.text_widget: tk.Text = text_widget
-        self.buffer: List[str] = []
-        self.update_pending: bool = False
+        self.buffer: Deque[str] = deque(maxlen=self.MAX_BUFFERED_LINES)
+        self.text_widget.after(self.FLUSH_INTERVAL_MS, self._periodic_flush)
         
     def emit(self, record: logging.LogRecord) -> None:
-        """输出日志记录到文本框
+        """输出日志记录到缓冲区
         
         Args:
             record: 日志记录对象
         """
         try:
-            msg = self.format(record)
-            self.buffer.append(msg + '\n')
-            
-            if not self.update_pending:
-                self.update_pending = True
-                self.text_widget.after(100, self._flush_buffer)
+            self.buffer.append(self.format(record) + '\n')
         except Exception:
             pass
             
-    def _flush_buffer(self) -> None:
-        """批量更新文本框"""
+    def _periodic_flush(self) -> None:
+        """定时批量更新文本框"""
         try:
-            if self.buffer:
-                text = ''.join(self.buffer)
-                self.text_widget.insert(tk.END, text)
+            # popleft 与其他线程的 append 互不干扰，取出本次刷新时已有的全部日志
+            buffer = self.buffer
+            lines = [buffer.popleft() for _ in range(len(buffer))]
+            if lines:
+                self.text_widget.insert(tk.END, ''.join(lines))
+                self.text_widget.delete('1.0', f'end-{self.MAX_LINES + 1}l')
                 self.text_widget.see(tk.END)
-                self.buffer.clear()
-            self.update_pending = False
         except Exception:
-            self.update_pending = False
+            pass
+        try:
+            self.text_widget.after(self.FLUSH_INTERVAL_MS, self._periodic_flush)
+        except Exception:
+            pass
 
 
 class DocumentExtractorGUI:
     """DOCX提取器图形界面"""
     
+    # 界面状态与日志的格式模板
+    STATUS_PROCESSING = "处理中: {}"              # 批量处理状态栏（当前文件名）
+    PROGRESS_FMT = "{}/{}"                         # 批量处理进度（已处理/总数）
+    LOG_FORMAT = '%(levelname)s: %(message)s'      # 日志区域的日志格式
+    STATUS_FLASH_MS = 3000                         # 处理完成后状态栏高亮的持续时间（毫秒）
+    
+    # 配置文件对话框的文件类型（JSON优先）
+    _CFG_FILETYPES = (
+        ("JSON文件", "*.json"),
+        ("YAML文件", "*.yaml"),
+        ("YAML文件", "*.yml"),
+        ("所有文件", "*.*"),
+    )
+    
     def __init__(self) -> None:
         """初始化GUI界面"""
         self.root: tk.Tk = tk.Tk()
@@ -92,6 +147,14 @@ class DocumentExtractorGUI:
         # 设置窗口背景色
         self.root.configure(bg=self.colors['bg'])
         
+        # 共享字体对象，所有组件引用同一个Tk字体而不是各自解析字体元组
+        self.fonts = {
+            'normal': tkfont.Font(self.root, family='Microsoft YaHei UI', size=9),                 # 普通文字
+            'button': tkfont.Font(self.root, family='Microsoft YaHei UI', size=9, weight='bold'),  # 按钮文字
+            'title': tkfont.Font(self.root, family='Microsoft YaHei UI', size=10, weight='bold'),  # 标题与主按钮
+            'log': tkfont.Font(self.root, family='Consolas', size=9),                             # 日志区域
+        }
+        
         self.config: Config = Config()
         self.processing: bool = False
         
@@ -104,6 +167,8 @@ class DocumentExtractorGUI:
         self.open_output_btn: Optional[tk.Button] = None
         self.log_text: Optional[scrolledtext.ScrolledText] = None
         self.status_var: Optional[tk.StringVar] = None
+        self.status_bar: Optional[tk.Label] = None
+        self._status_flash_id: Optional[str] = None
         
         # 批量处理相关组件
         self.batch_input_var: Optional[tk.StringVar] = None
@@ -117,14 +182,45 @@ class DocumentExtractorGUI:
         self.open_batch_output_btn: Optional[tk.Button] = None
         self.batch_log_text: Optional[scrolledtext.ScrolledText] = None
         
+        # 批量处理日志缓冲区与最新进度（后台线程写入，定时器在主线程中刷新到界面）
+        self._batch_log_buf: List[str] = []
+        self._batch_log_lock = threading.Lock()
+        self._batch_progress: Optional[Tuple[int, int, str]] = None
+        self._batch_tick_active: bool = False
+        self._last_pct: int = -1
+        
         # 设置相关组件
         self.width_var: Optional[tk.IntVar] = None
         self.indent_var: Optional[tk.StringVar] = None
         self.col_width_var: Optional[tk.IntVar] = None
+        self.max_workers_var: Optional[tk.IntVar] = None
+        # 界面设置是否在上次应用到配置对象之后被修改过
+        self._settings_dirty: bool = False
         
         # 处理结果
         self.last_output_file: Optional[str] = None
         self.batch_output_dir: Optional[str] = None
+        # 输出路径在处理完成时刚刚写入，打开时无需再次检查是否存在；开始新的处理时失效
+        self._last_output_valid: bool = False
+        self._batch_output_valid: bool = False
+        
+        # 日志队列与监听器（在独立线程中把日志队列转交给GUI日志处理器），批量处理子进程也写入该队列
+        self._log_queue: Optional[multiprocessing.Queue] = None
+        self.log_listener: Optional[logging.handlers.QueueListener] = None
+        
+        # 批量处理进程池，跨多次批量处理复用，进程数变化时重建
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers: int = 0
+        
+        # 目录扫描缓存：(输入目录, 是否递归) -> (遍历过的各目录及其mtime, DOCX文件列表)
+        self._scan_cache: Dict[Tuple[str, bool], Tuple[List[Tuple[str, int]], List[str]]] = {}
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # 按钮悬停效果：Button类上只绑定一次，各按钮只登记 (正常颜色, 悬停颜色)
+        self._hover_colors: Dict[str, Tuple[str, str]] = {}
+        self.root.bind_class('Button', '<Enter>', lambda e: self._on_button_hover(e, True), add='+')
+        self.root.bind_class('Button', '<Leave>', lambda e: self._on_button_hover(e, False), add='+')
         
         self.setup_ui()
         self.setup_logging()
@@ -159,27 +255,29 @@ class DocumentExtractorGUI:
         # 文件处理标签页
         self.setup_file_tab(notebook)
         
-        # 批量处理标签页
-        self.setup_batch_tab(notebook)
-        
-        # 设置标签页
-        self.setup_settings_tab(notebook)
+        # 批量处理与设置标签页先添加空白页，首次切换到该页时再创建其中的组件
+        self._lazy_tabs: Dict[str, Tuple[Callable[[ttk.Frame], None], ttk.Frame]] = {}
+        for text, setup in (("📁 批量处理", self.setup_batch_tab), ("⚙️ 设置", self.setup_settings_tab)):
+            frame = ttk.Frame(notebook)
+            notebook.add(frame, text=text)
+            self._lazy_tabs[str(frame)] = (setup, frame)
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # 状态栏
         self.status_var = tk.StringVar()
         self.status_var.set("就绪")
-        status_bar = tk.Label(
+        self.status_bar = tk.Label(
             self.root, 
             textvariable=self.status_var, 
             relief=tk.FLAT,
             anchor=tk.W,
             bg=self.colors['primary'],
             fg='white',
-            font=('Microsoft YaHei UI', 9),
+            font=self.fonts['normal'],
             padx=10,
             pady=5
         )
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
     def setup_file_tab(self, notebook):
         """设置文件处理标签页"""
@@ -194,15 +292,15 @@ class DocumentExtractorGUI:
         input_frame.pack(fill=tk.X, padx=15, pady=15)
         
         tk.Label(input_frame, text="选择DOCX文件:", bg=self.colors['card_bg'], 
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 10, 'bold')).pack(side=tk.LEFT)
+                fg=self.colors['fg'], font=self.fonts['title']).pack(side=tk.LEFT)
         self.file_path_var = tk.StringVar()
         self.file_entry = tk.Entry(input_frame, textvariable=self.file_path_var, 
-                                   font=('Microsoft YaHei UI', 9), relief=tk.SOLID, bd=1)
+                                   font=self.fonts['normal'], relief=tk.SOLID, bd=1)
         self.file_entry.pack(side=tk.LEFT, padx=(10, 5), fill=tk.X, expand=True, ipady=5)
         
         browse_btn = tk.Button(input_frame, text="浏览", command=self.browse_file,
                               bg=self.colors['primary'], fg='white', 
-                              font=('Microsoft YaHei UI', 9, 'bold'),
+                              font=self.fonts['button'],
                               relief=tk.FLAT, cursor='hand2', padx=20, pady=5)
         browse_btn.pack(side=tk.LEFT, padx=(5, 0))
         self._add_hover_effect(browse_btn, self.colors['primary'], self.colors['hover'])
@@ -215,10 +313,10 @@ class DocumentExtractorGUI:
         output_frame.pack(fill=tk.X, padx=15, pady=15)
         
         tk.Label(output_frame, text="输出目录:", bg=self.colors['card_bg'],
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 10, 'bold')).pack(side=tk.LEFT)
+                fg=self.colors['fg'], font=self.fonts['title']).pack(side=tk.LEFT)
         self.output_dir_var = tk.StringVar()
         self.output_entry = tk.Entry(output_frame, textvariable=self.output_dir_var,
-                                    font=('Microsoft YaHei UI', 9), relief=tk.SOLID, bd=1,
+                                    font=self.fonts['normal'], relief=tk.SOLID, bd=1,
                                     fg='#999999')
         self.output_entry.pack(side=tk.LEFT, padx=(10, 5), fill=tk.X, expand=True, ipady=5)
         # 添加占位符提示
@@ -226,7 +324,7 @@ class DocumentExtractorGUI:
         
         output_browse_btn = tk.Button(output_frame, text="浏览", command=self.browse_output_dir,
                                      bg=self.colors['primary'], fg='white',
-                                     font=('Microsoft YaHei UI', 9, 'bold'),
+                                     font=self.fonts['button'],
                                      relief=tk.FLAT, cursor='hand2', padx=20, pady=5)
         output_browse_btn.pack(side=tk.LEFT, padx=(5, 0))
         self._add_hover_effect(output_browse_btn, self.colors['primary'], self.colors['hover'])
@@ -237,7 +335,7 @@ class DocumentExtractorGUI:
         
         self.process_btn = tk.Button(button_frame, text="▶ 开始处理", command=self.process_file,
                                     bg=self.colors['success'], fg='white',
-                                    font=('Microsoft YaHei UI', 10, 'bold'),
+                                    font=self.fonts['title'],
                                     relief=tk.FLAT, cursor='hand2', padx=30, pady=10)
         self.process_btn.pack(side=tk.LEFT)
         self._add_hover_effect(self.process_btn, self.colors['success'], '#229954')
@@ -245,7 +343,7 @@ class DocumentExtractorGUI:
         self.open_output_btn = tk.Button(button_frame, text="📂 打开输出文件", 
                                         command=self.open_output_file, state=tk.DISABLED,
                                         bg=self.colors['secondary'], fg='white',
-                                        font=('Microsoft YaHei UI', 9, 'bold'),
+                                        font=self.fonts['button'],
                                         relief=tk.FLAT, cursor='hand2', padx=20, pady=8)
         self.open_output_btn.pack(side=tk.LEFT, padx=(10, 0))
         
@@ -257,7 +355,7 @@ class DocumentExtractorGUI:
         log_header.pack(fill=tk.X, padx=15, pady=(10, 5))
         
         tk.Label(log_header, text="📋 处理日志", bg=self.colors['card_bg'],
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 10, 'bold')).pack(anchor=tk.W)
+                fg=self.colors['fg'], font=self.fonts['title']).pack(anchor=tk.W)
         
         log_content = tk.Frame(log_card, bg=self.colors['card_bg'])
         log_content.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
@@ -265,7 +363,7 @@ class DocumentExtractorGUI:
         self.log_text = scrolledtext.ScrolledText(
             log_content, 
             wrap=tk.WORD,
-            font=("Consolas", 9),
+            font=self.fonts['log'],
             bg='#fafafa',
             fg=self.colors['fg'],
             relief=tk.SOLID,
@@ -273,11 +371,15 @@ class DocumentExtractorGUI:
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
         
-    def setup_batch_tab(self, notebook):
-        """设置批量处理标签页"""
-        batch_frame = ttk.Frame(notebook)
-        notebook.add(batch_frame, text="📁 批量处理")
+    def _on_tab_changed(self, event) -> None:
+        """标签页切换回调：首次显示的标签页在此时创建组件"""
+        tab = self._lazy_tabs.pop(event.widget.select(), None)
+        if tab:
+            setup, frame = tab
+            setup(frame)
         
+    def setup_batch_tab(self, batch_frame):
+        """设置批量处理标签页"""
         # 目录选择区域 - 卡片样式
         input_card = tk.Frame(batch_frame, bg=self.colors['card_bg'], relief=tk.FLAT, bd=1)
         input_card.pack(fill=tk.X, pady=(5, 10), padx=5)
@@ -286,15 +388,15 @@ class DocumentExtractorGUI:
         input_frame.pack(fill=tk.X, padx=15, pady=15)
         
         tk.Label(input_frame, text="选择输入目录:", bg=self.colors['card_bg'],
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 10, 'bold')).pack(side=tk.LEFT)
+                fg=self.colors['fg'], font=self.fonts['title']).pack(side=tk.LEFT)
         self.batch_input_var = tk.StringVar()
         self.batch_input_entry = tk.Entry(input_frame, textvariable=self.batch_input_var,
-                                         font=('Microsoft YaHei UI', 9), relief=tk.SOLID, bd=1)
+                                         font=self.fonts['normal'], relief=tk.SOLID, bd=1)
         self.batch_input_entry.pack(side=tk.LEFT, padx=(10, 5), fill=tk.X, expand=True, ipady=5)
         
         batch_browse_btn = tk.Button(input_frame, text="浏览", command=self.browse_batch_input,
                                     bg=self.colors['primary'], fg='white',
-                                    font=('Microsoft YaHei UI', 9, 'bold'),
+                                    font=self.fonts['button'],
                                     relief=tk.FLAT, cursor='hand2', padx=20, pady=5)
         batch_browse_btn.pack(side=tk.LEFT, padx=(5, 0))
         self._add_hover_effect(batch_browse_btn, self.colors['primary'], self.colors['hover'])
@@ -307,10 +409,10 @@ class DocumentExtractorGUI:
         output_frame.pack(fill=tk.X, padx=15, pady=15)
         
         tk.Label(output_frame, text="输出目录:", bg=self.colors['card_bg'],
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 10, 'bold')).pack(side=tk.LEFT)
+                fg=self.colors['fg'], font=self.fonts['title']).pack(side=tk.LEFT)
         self.batch_output_var = tk.StringVar()
         self.batch_output_entry = tk.Entry(output_frame, textvariable=self.batch_output_var,
-                                          font=('Microsoft YaHei UI', 9), relief=tk.SOLID, bd=1,
+                                          font=self.fonts['normal'], relief=tk.SOLID, bd=1,
                                           fg='#999999')
         self.batch_output_entry.pack(side=tk.LEFT, padx=(10, 5), fill=tk.X, expand=True, ipady=5)
         # 添加占位符提示
@@ -318,7 +420,7 @@ class DocumentExtractorGUI:
         
         batch_output_browse_btn = tk.Button(output_frame, text="浏览", command=self.browse_batch_output,
                                            bg=self.colors['primary'], fg='white',
-                                           font=('Microsoft YaHei UI', 9, 'bold'),
+                                           font=self.fonts['button'],
                                            relief=tk.FLAT, cursor='hand2', padx=20, pady=5)
         batch_output_browse_btn.pack(side=tk.LEFT, padx=(5, 0))
         self._add_hover_effect(batch_output_browse_btn, self.colors['primary'], self.colors['hover'])
@@ -333,7 +435,7 @@ class DocumentExtractorGUI:
         self.recursive_var = tk.BooleanVar(value=True)
         recursive_check = tk.Checkbutton(options_frame, text="递归搜索子目录", variable=self.recursive_var,
                                         bg=self.colors['card_bg'], fg=self.colors['fg'],
-                                        font=('Microsoft YaHei UI', 9), selectcolor=self.colors['card_bg'])
+                                        font=self.fonts['normal'], selectcolor=self.colors['card_bg'])
         recursive_check.pack(side=tk.LEFT)
         
         # 进度条 - 卡片样式
@@ -344,10 +446,10 @@ class DocumentExtractorGUI:
         progress_frame.pack(fill=tk.X, padx=15, pady=12)
         
         tk.Label(progress_frame, text="处理进度:", bg=self.colors['card_bg'],
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 9, 'bold')).pack(side=tk.LEFT)
+                fg=self.colors['fg'], font=self.fonts['button']).pack(side=tk.LEFT)
         self.progress_var = tk.StringVar(value="0/0")
         tk.Label(progress_frame, textvariable=self.progress_var, bg=self.colors['card_bg'],
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 9)).pack(side=tk.LEFT, padx=(10, 0))
+                fg=self.colors['fg'], font=self.fonts['normal']).pack(side=tk.LEFT, padx=(10, 0))
         
         self.progress_bar = ttk.Progressbar(progress_frame, mode='determinate')
         self.progress_bar.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
@@ -358,7 +460,7 @@ class DocumentExtractorGUI:
         
         self.batch_process_btn = tk.Button(batch_button_frame, text="▶ 开始批量处理", command=self.process_batch,
                                           bg=self.colors['success'], fg='white',
-                                          font=('Microsoft YaHei UI', 10, 'bold'),
+                                          font=self.fonts['title'],
                                           relief=tk.FLAT, cursor='hand2', padx=30, pady=10)
         self.batch_process_btn.pack(side=tk.LEFT)
         self._add_hover_effect(self.batch_process_btn, self.colors['success'], '#229954')
@@ -366,7 +468,7 @@ class DocumentExtractorGUI:
         self.open_batch_output_btn = tk.Button(batch_button_frame, text="📂 打开输出目录", 
                                               command=self.open_batch_output, state=tk.DISABLED,
                                               bg=self.colors['secondary'], fg='white',
-                                              font=('Microsoft YaHei UI', 9, 'bold'),
+                                              font=self.fonts['button'],
                                               relief=tk.FLAT, cursor='hand2', padx=20, pady=8)
         self.open_batch_output_btn.pack(side=tk.LEFT, padx=(10, 0))
         
@@ -378,7 +480,7 @@ class DocumentExtractorGUI:
         batch_log_header.pack(fill=tk.X, padx=15, pady=(10, 5))
         
         tk.Label(batch_log_header, text="📋 批量处理日志", bg=self.colors['card_bg'],
-                fg=self.colors['fg'], font=('Microsoft YaHei UI', 10, 'bold')).pack(anchor=tk.W)
+                fg=self.colors['fg'], font=self.fonts['title']).pack(anchor=tk.W)
         
         batch_log_content = tk.Frame(batch_log_card, bg=self.colors['card_bg'])
         batch_log_content.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
@@ -386,7 +488,7 @@ class DocumentExtractorGUI:
         self.batch_log_text = scrolledtext.ScrolledText(
             batch_log_content, 
             wrap=tk.WORD,
-            font=("Consolas", 9),
+            font=self.fonts['log'],
             bg='#fafafa',
             fg=self.colors['fg'],
             relief=tk.SOLID,
@@ -394,11 +496,8 @@ class DocumentExtractorGUI:
         )
         self.batch_log_text.pack(fill=tk.BOTH, expand=True)
         
-    def setup_settings_tab(self, notebook):
+    def setup_settings_tab(self, settings_frame):
         """设置配置标签页"""
-        settings_frame = ttk.Frame(notebook)
-        notebook.add(settings_frame, text="⚙️ 设置")
-        
         # 文本格式设置
         text_group = ttk.LabelFrame(settings_frame, text="文本格式设置")
         text_group.pack(fill=tk.X, padx=5, pady=5)
@@ -431,27 +530,43 @@ class DocumentExtractorGUI:
         col_width_spin = tk.Spinbox(col_width_frame, from_=8, to=50, textvariable=self.col_width_var, width=10)
         col_width_spin.pack(side=tk.LEFT, padx=(10, 0))
         
+        # 处理设置
+        process_group = ttk.LabelFrame(settings_frame, text="处理设置")
+        process_group.pack(fill=tk.X, padx=5, pady=5)
+        
+        # 并行进程数
+        workers_frame = tk.Frame(process_group)
+        workers_frame.pack(fill=tk.X, padx=5, pady=2)
+        tk.Label(workers_frame, text="并行进程数（0=自动）:").pack(side=tk.LEFT)
+        self.max_workers_var = tk.IntVar(value=self.config.max_workers)
+        workers_spin = tk.Spinbox(workers_frame, from_=0, to=64, textvariable=self.max_workers_var, width=10)
+        workers_spin.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # 任一设置被修改时标记为待应用，未修改时应用设置无需读取界面变量
+        for var in (self.width_var, self.indent_var, self.col_width_var, self.max_workers_var):
+            var.trace_add('write', self._mark_settings_dirty)
+        
         # 按钮区域
         button_group = tk.Frame(settings_frame, bg=self.colors['bg'])
         button_group.pack(fill=tk.X, padx=5, pady=10)
         
         save_config_btn = tk.Button(button_group, text="💾 保存配置", command=self.save_config,
                                    bg=self.colors['success'], fg='white',
-                                   font=('Microsoft YaHei UI', 9, 'bold'),
+                                   font=self.fonts['button'],
                                    relief=tk.FLAT, cursor='hand2', padx=20, pady=8)
         save_config_btn.pack(side=tk.LEFT)
         self._add_hover_effect(save_config_btn, self.colors['success'], '#229954')
         
         load_config_btn = tk.Button(button_group, text="📂 加载配置", command=self.load_config,
                                    bg=self.colors['primary'], fg='white',
-                                   font=('Microsoft YaHei UI', 9, 'bold'),
+                                   font=self.fonts['button'],
                                    relief=tk.FLAT, cursor='hand2', padx=20, pady=8)
         load_config_btn.pack(side=tk.LEFT, padx=(10, 0))
         self._add_hover_effect(load_config_btn, self.colors['primary'], self.colors['hover'])
         
         reset_config_btn = tk.Button(button_group, text="🔄 重置为默认", command=self.reset_config,
                                     bg=self.colors['secondary'], fg='white',
-                                    font=('Microsoft YaHei UI', 9, 'bold'),
+                                    font=self.fonts['button'],
                                     relief=tk.FLAT, cursor='hand2', padx=20, pady=8)
         reset_config_btn.pack(side=tk.LEFT, padx=(10, 0))
         self._add_hover_effect(reset_config_btn, self.colors['secondary'], '#7f8c8d')
@@ -489,26 +604,39 @@ class DocumentExtractorGUI:
             normal_color: 正常颜色
             hover_color: 悬停颜色
         """
-        def on_enter(e):
-            button['bg'] = hover_color
+        self._hover_colors[str(button)] = (normal_color, hover_color)
         
-        def on_leave(e):
-            button['bg'] = normal_color
+    def _on_button_hover(self, event: tk.Event, hovered: bool) -> None:
+        """按钮类绑定的悬停处理：只对登记过悬停颜色的按钮切换背景色
         
-        button.bind('<Enter>', on_enter)
-        button.bind('<Leave>', on_leave)
+        Args:
+            event: 鼠标进入/离开事件
+            hovered: 是否为鼠标进入
+        """
+        colors = self._hover_colors.get(str(event.widget))
+        if colors:
+            event.widget['bg'] = colors[hovered]
     
     def setup_logging(self) -> None:
-        """设置日志系统"""
+        """设置日志系统
+        
+        根日志记录器只挂载QueueHandler，调用logger的线程仅需入队；
+        由QueueListener线程交给GUI日志处理器缓冲，再由定时器统一写入文本框。
+        队列可跨进程使用，批量处理子进程的日志也经该队列显示在日志区域。
+        """
         # 为单文件处理设置日志处理器
         gui_handler = GUILogHandler(self.log_text)
-        gui_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+        gui_handler.setFormatter(logging.Formatter(self.LOG_FORMAT))
         gui_handler.setLevel(logging.INFO)
         
+        self._log_queue = multiprocessing.Queue()
+        self.log_listener = logging.handlers.QueueListener(self._log_queue, gui_handler, respect_handler_level=True)
+        self.log_listener.start()
+        
         logger = logging.getLogger()
         logger.setLevel(logging.INFO)
         logger.handlers.clear()
-        logger.addHandler(gui_handler)
+        logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
         
     def browse_file(self) -> None:
         """浏览文件对话框"""
@@ -549,36 +677,40 @@ class DocumentExtractorGUI:
             messagebox.showerror("错误", "请选择一个DOCX文件")
             return
             
-        if not os.path.exists(file_path):
-            messagebox.showerror("错误", "文件不存在")
-            return
-            
         if not file_path.lower().endswith('.docx'):
             messagebox.showerror("错误", "请选择DOCX格式的文件")
             return
             
+        # 界面变量只在主线程中读取，后台线程只接收普通的值
+        try:
+            self._apply_settings_to_config()
+        except Exception as e:
+            self._on_process_error(str(e))
+            return
+        output_dir = self.output_dir_var.get().strip()
+        
+        self._last_output_valid = False
+        self.processing = True
+        self.status_var.set("处理中...")
+        self.process_btn.config(state=tk.DISABLED)
+        
         # 清空日志区域
         self.log_text.delete(1.0, tk.END)
         
-        # 在新线程中处理文件
-        threading.Thread(target=self._process_file_thread, args=(file_path,), daemon=True).start()
+        # 在后台线程中处理文件
+        self._run_async(self._process_file_thread, file_path, output_dir)
         
-    def _process_file_thread(self, file_path):
-        """在后台线程中处理文件"""
+    def _process_file_thread(self, file_path, output_dir):
+        """在后台线程中处理文件（不直接访问Tk组件，界面更新通过root.after交给主线程）"""
         try:
-            self.processing = True
-            self.status_var.set("处理中...")
-            self.process_btn.config(state=tk.DISABLED)
-            
-            # 应用设置到配置
-            self._apply_settings_to_config()
+            # 按需导入核心模块（python-docx/lxml导入较慢），避免拖慢界面启动
+            from core import DocumentExtractor
             
+            # 与原有界面输出保持一致：提取器使用默认格式（设置页的宽度等选项不参与提取）
             extractor = DocumentExtractor()
-            content = extractor.extract_content(file_path)
+            chunks = extractor.iter_content(file_path)
             
-            # 确定输出路径
-            output_dir = self.output_dir_var.get().strip()
-            # 检查是否为占位符文字或空
+            # 确定输出路径，检查是否为占位符文字或空
             if output_dir and not output_dir.startswith('（可选）'):
                 output_path = Path(output_dir) / f"{Path(file_path).stem}.md"
             else:
@@ -587,9 +719,17 @@ class DocumentExtractorGUI:
             # 确保输出目录存在
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # 保存文件
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # 边提取边写入临时文件，避免完整内容与写缓冲同时驻留内存；提取成功后再替换输出文件，
+            # 中途失败时已有的输出文件保持不变
+            temp_path = output_path.with_name(output_path.name + '.tmp')
+            try:
+                with open(temp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.writelines(chunks)
+                os.replace(temp_path, output_path)
+            except Exception:
+                # 提取中途失败时删除不完整的临时文件
+                temp_path.unlink(missing_ok=True)
+                raise
             
             self.last_output_file = str(output_path)
             
@@ -597,16 +737,36 @@ class DocumentExtractorGUI:
             self.root.after(0, self._on_process_complete, str(output_path))
             
         except Exception as e:
-            self.root.after(0, self._on_process_error, str(e))
+            # 不预先检查文件是否存在，仅在失败时判断以给出明确提示
+            error_msg = str(e) if os.path.exists(file_path) else f"文件不存在: {file_path}"
+            self.root.after(0, self._on_process_error, error_msg)
         finally:
             self.processing = False
-            self.root.after(0, lambda: self.process_btn.config(state=tk.NORMAL))
+            self.root.after(0, partial(self.process_btn.config, state=tk.NORMAL))
             
+    def _flash_status(self, text: str, color: str) -> None:
+        """在状态栏显示结果并短暂高亮（非模态，不阻塞事件循环）
+        
+        Args:
+            text: 状态文字
+            color: 高亮背景色，STATUS_FLASH_MS 毫秒后恢复为主色调
+        """
+        self.status_var.set(text)
+        self.status_bar.config(bg=color)
+        if self._status_flash_id:
+            self.root.after_cancel(self._status_flash_id)
+        self._status_flash_id = self.root.after(self.STATUS_FLASH_MS, self._reset_status_color)
+        
+    def _reset_status_color(self) -> None:
+        """恢复状态栏背景色"""
+        self._status_flash_id = None
+        self.status_bar.config(bg=self.colors['primary'])
+        
     def _on_process_complete(self, output_path):
         """处理完成回调"""
-        self.status_var.set("处理完成")
+        self._last_output_valid = True
         self.open_output_btn.config(state=tk.NORMAL)
-        messagebox.showinfo("成功", f"文件处理完成!\n输出文件: {output_path}")
+        self._flash_status(f"✓ 处理完成: {output_path}", self.colors['success'])
         
     def _on_process_error(self, error_msg):
         """处理错误回调"""
@@ -623,8 +783,9 @@ class DocumentExtractorGUI:
             messagebox.showerror("错误", "请选择输入目录")
             return
             
-        if not os.path.exists(input_dir):
-            messagebox.showerror("错误", "输入目录不存在")
+        # 批量处理只接受目录，单个文件请使用单文件处理（输出路径按输入目录的相对路径计算）
+        if not os.path.isdir(input_dir):
+            messagebox.showerror("错误", "输入目录不存在或不是目录")
             return
             
         output_dir = self.batch_output_var.get().strip()
@@ -632,155 +793,343 @@ class DocumentExtractorGUI:
         if not output_dir or output_dir.startswith('（可选）'):
             output_dir = input_dir
             
+        # 在主线程读取界面设置（批量处理只使用其中的并行进程数，提取器使用默认格式）
+        try:
+            self._apply_settings_to_config()
+        except Exception as e:
+            self._on_batch_error(str(e))
+            return
+        recursive = self.recursive_var.get()
+        
+        self._batch_output_valid = False
+        self.batch_process_btn.config(state=tk.DISABLED)
+        self.status_var.set("查找文件中...")
+        
         # 清空日志
         self.batch_log_text.delete(1.0, tk.END)
         
-        # 在新线程中处理
-        threading.Thread(target=self._process_batch_thread, args=(input_dir, output_dir), daemon=True).start()
-        
-    def _process_batch_thread(self, input_dir, output_dir):
-        """批量处理后台线程"""
+        # 启动日志与进度的定时刷新，处理结束后最后一次刷新时自动停止
+        self.processing = True
+        with self._batch_log_lock:
+            self._batch_log_buf = []
+            self._batch_progress = None
+        self._last_pct = -1
+        if not self._batch_tick_active:
+            self._batch_tick_active = True
+            self.root.after(BATCH_FLUSH_INTERVAL_MS, self._tick_ui)
+        
+        # 在后台线程中处理
+        self._run_async(self._process_batch_thread, input_dir, output_dir, recursive)
+        
+    def _process_batch_thread(self, input_dir, output_dir, recursive):
+        """批量处理后台线程（不直接访问Tk组件，进度与日志写入缓冲区由定时器刷新到界面）"""
         try:
-            self.processing = True
-            self.root.after(0, lambda: self.batch_process_btn.config(state=tk.DISABLED))
-            self.root.after(0, lambda: self.status_var.set("查找文件中..."))
+            from core import DocumentExtractor, process_single_file
             
-            # 查找DOCX文件
-            docx_files = []
-            input_path = Path(input_dir)
-            
-            if self.recursive_var.get():
-                pattern = '**/*.docx'
-            else:
-                pattern = '*.docx'
-                
-            for file_path in input_path.glob(pattern):
-                if not file_path.name.startswith('~$'):
-                    docx_files.append(file_path)
+            # 查找DOCX文件（目录不存在时由遍历本身报错，不预先检查）
+            try:
+                docx_files = self._find_docx_files_cached(input_dir, recursive)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"输入目录不存在: {input_dir}") from None
             
             if not docx_files:
-                self.root.after(0, lambda: messagebox.showwarning("警告", "未找到DOCX文件"))
+                self.root.after(0, self._flash_status, "未找到DOCX文件", self.colors['danger'])
                 return
             
             # 更新进度条
             total_files = len(docx_files)
-            self.root.after(0, lambda: self.progress_bar.config(maximum=total_files))
-            self.root.after(0, lambda: self.progress_var.set(f"0/{total_files}"))
+            self.root.after(0, partial(self.progress_bar.config, maximum=total_files))
+            self.root.after(0, self.progress_var.set, self.PROGRESS_FMT.format(0, total_files))
             
-            # 处理文件
-            success_count = 0
-            extractor = DocumentExtractor()
+            # 预先计算输出路径，每个输出目录只创建一次
+            # 遍历得到的路径都以"输入目录+分隔符"开头，直接切片得到相对路径，其余情况回退到relpath
+            input_prefix = os.path.join(input_dir, '')
+            prefix_len = len(input_prefix)
+            output_root = os.path.abspath(output_dir)
+            output_paths = [os.path.join(output_root, (file_path[prefix_len:] if file_path.startswith(input_prefix)
+                                                       else os.path.relpath(file_path, input_dir))[:-5] + '.md')
+                            for file_path in docx_files]
+            for parent in {os.path.dirname(output_path) for output_path in output_paths}:
+                os.makedirs(parent, exist_ok=True)
             
-            for i, file_path in enumerate(docx_files):
-                try:
-                    self.root.after(0, lambda: self.status_var.set(f"处理中: {file_path.name}"))
-                    
-                    content = extractor.extract_content(str(file_path))
-                    
-                    # 确定输出路径
-                    relative_path = file_path.relative_to(input_path)
-                    output_path = Path(output_dir) / relative_path.with_suffix('.md')
-                    
-                    # 确保输出目录存在
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # 保存文件
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    
-                    success_count += 1
+            # 处理文件：文件较多时使用进程池并行提取，文件较少时直接在当前进程处理以避免进程启动开销
+            workers = self.config.max_workers or os.cpu_count() or 1
+            if total_files >= PROCESS_POOL_MIN_FILES and workers > 1:
+                chunksize = max(1, total_files // (4 * workers))
+                results = self._get_pool(workers).map(
+                    process_single_file, docx_files, chunksize=chunksize)
+            else:
+                results = map(process_single_file, docx_files, repeat(DocumentExtractor()))
+            
+            # 写入交给后台线程，与下一个文件的提取重叠进行
+            write_futures = []
+            with ThreadPoolExecutor(max_workers=2) as writer:
+                for i, (file_path, output_path, (ok, result)) in enumerate(zip(docx_files, output_paths, results)):
+                    file_name = os.path.basename(file_path)
                     
-                    # 更新进度
-                    progress = i + 1
-                    self.root.after(0, lambda p=progress: self.progress_bar.config(value=p))
-                    self.root.after(0, lambda p=progress, t=total_files: self.progress_var.set(f"{p}/{t}"))
+                    # 只记录最新的进度和文件名，由定时器刷新到界面
+                    with self._batch_log_lock:
+                        self._batch_progress = (i + 1, total_files, file_name)
                     
-                    # 添加日志
-                    log_msg = f"✓ {file_path.name} -> {output_path.name}\n"
-                    self.root.after(0, lambda msg=log_msg: self.batch_log_text.insert(tk.END, msg))
-                    self.root.after(0, lambda: self.batch_log_text.see(tk.END))
+                    if not ok:
+                        self._append_batch_log(f"✗ {file_name}: {result}\n")
+                        continue
                     
-                except Exception as e:
-                    log_msg = f"✗ {file_path.name}: {str(e)}\n"
-                    self.root.after(0, lambda msg=log_msg: self.batch_log_text.insert(tk.END, msg))
-                    self.root.after(0, lambda: self.batch_log_text.see(tk.END))
+                    write_futures.append(writer.submit(self._write_batch_output, output_path, result, file_name))
+            
+            success_count = sum(future.result() for future in write_futures)
             
             # 完成处理
             self.batch_output_dir = output_dir
-            self.root.after(0, lambda: self._on_batch_complete(success_count, total_files))
+            self.root.after(0, self._on_batch_complete, success_count, total_files)
             
         except Exception as e:
-            self.root.after(0, lambda: self._on_batch_error(str(e)))
+            # 子进程异常退出后进程池不可再用，下次批量处理时重新创建
+            if isinstance(e, BrokenProcessPool):
+                self._shutdown_pool()
+            self.root.after(0, self._on_batch_error, str(e))
         finally:
-            self.processing = False
-            self.root.after(0, lambda: self.batch_process_btn.config(state=tk.NORMAL))
+            self._finish_batch()
             
+    def _finish_batch(self) -> None:
+        """结束批量处理：清除处理中标记并恢复批量处理按钮（所有退出路径都会调用）"""
+        self.processing = False
+        self.root.after(0, partial(self.batch_process_btn.config, state=tk.NORMAL))
+        
+    def _find_docx_files_cached(self, input_dir: str, recursive: bool) -> List[str]:
+        """查找DOCX文件，目录内容未变化时复用上次的扫描结果
+        
+        遍历过的每个目录的mtime都未变化（没有增删条目）时，直接返回缓存的文件列表，
+        只需对各目录做一次stat而不必重新列出全部条目。
+        
+        Args:
+            input_dir: 输入目录
+            recursive: 是否递归搜索子目录
+            
+        Returns:
+            DOCX文件路径列表
+        """
+        from core import find_docx_files
+        
+        key = (input_dir, recursive)
+        cached = self._scan_cache.get(key)
+        if cached:
+            dir_mtimes, docx_files = cached
+            try:
+                if all(os.stat(dir_path).st_mtime_ns == mtime for dir_path, mtime in dir_mtimes):
+                    return docx_files
+            except OSError:
+                pass
+        
+        # 各目录的mtime在列出该目录之前记录，遍历期间新增的文件会在下次检查时使缓存失效
+        visited_dirs: List[Tuple[str, int]] = []
+        docx_files = find_docx_files(input_dir, recursive, visited_dirs)
+        self._scan_cache[key] = (visited_dirs, docx_files)
+        return docx_files
+        
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        """获取批量处理进程池（首次使用时创建，之后复用已预热的子进程）
+        
+        子进程在启动时导入python-docx并创建提取器，日志经日志队列转发到主进程；
+        进程数变化时关闭旧进程池重新创建。
+        
+        Args:
+            workers: 进程数
+            
+        Returns:
+            进程池
+        """
+        from core import init_worker
+        
+        if self._pool is None or self._pool_workers != workers:
+            self._shutdown_pool()
+            # 每个子进程只创建一次提取器，供该进程处理的所有文件复用
+            self._pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                             initargs=(self._log_queue,))
+            self._pool_workers = workers
+        return self._pool
+        
+    def _shutdown_pool(self, kill: bool = False) -> None:
+        """关闭批量处理进程池（不等待子进程退出）
+        
+        Args:
+            kill: 是否同时终止子进程。cancel_futures只取消尚未交给子进程的任务，
+                  已在执行的任务会让退出时的concurrent.futures清理钩子一直等到其完成
+        """
+        if self._pool is not None:
+            # shutdown会清空进程池的进程表，需要先取出子进程
+            processes = list((self._pool._processes or {}).values()) if kill else []
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                process.terminate()
+            self._pool = None
+            self._pool_workers = 0
+            
+    def _on_close(self) -> None:
+        """关闭窗口：终止进程池子进程后退出主循环
+        
+        处理线程为守护线程；子进程中正在执行的批量任务被直接终止，不等待其完成。
+        """
+        self._shutdown_pool(kill=True)
+        self.root.destroy()
+            
+    def _write_batch_output(self, output_path, data, source_name):
+        """写入一个批量处理的输出文件并记录日志（在写入线程中执行）
+        
+        Returns:
+            True如果写入成功，否则False
+        """
+        try:
+            _write_output(output_path, data)
+        except Exception as e:
+            self._append_batch_log(f"✗ {source_name}: {str(e)}\n")
+            return False
+        self._append_batch_log(f"✓ {source_name} -> {os.path.basename(output_path)}\n")
+        return True
+            
+    def _append_batch_log(self, log_msg):
+        """追加一行批量处理日志到缓冲区（可在后台线程调用）"""
+        with self._batch_log_lock:
+            self._batch_log_buf.append(log_msg)
+            
+    def _tick_ui(self):
+        """定时把缓冲的批量处理日志、最新进度和状态刷新到界面（在主线程中执行）"""
+        # 先读取处理标记再取缓冲区：标记清除前后台线程已写完全部日志，标记为False时的这次刷新即为最后一次
+        running = self.processing
+        # 处理结束后状态栏显示的是完成/失败结果，不再用当前文件名覆盖
+        self._flush_batch_ui(show_status=running)
+        
+        if running:
+            self.root.after(BATCH_FLUSH_INTERVAL_MS, self._tick_ui)
+        else:
+            self._batch_tick_active = False
+            
+    def _flush_batch_ui(self, show_status: bool) -> None:
+        """把缓冲的批量处理日志和最新进度写入界面（在主线程中执行）
+        
+        Args:
+            show_status: 是否在状态栏显示当前处理的文件名
+        """
+        with self._batch_log_lock:
+            lines, self._batch_log_buf = self._batch_log_buf, []
+            progress, self._batch_progress = self._batch_progress, None
+        if lines:
+            self.batch_log_text.insert(tk.END, ''.join(lines))
+            self.batch_log_text.delete('1.0', f'end-{GUILogHandler.MAX_LINES + 1}l')
+            self.batch_log_text.see(tk.END)
+        
+        if progress:
+            done, total, file_name = progress
+            # 进度条只在百分比变化时重绘，整个批次最多更新约100次
+            pct = done * 100 // total
+            if pct != self._last_pct:
+                self._last_pct = pct
+                self.progress_bar.config(value=done)
+            self.progress_var.set(self.PROGRESS_FMT.format(done, total))
+            if show_status:
+                self.status_var.set(self.STATUS_PROCESSING.format(file_name))
+        
     def _on_batch_complete(self, success_count, total_files):
         """批量处理完成回调"""
-        self.status_var.set(f"批量处理完成: {success_count}/{total_files}")
+        # 先取走尚未显示的日志和进度，之后的定时刷新不会再覆盖完成状态
+        self._flush_batch_ui(show_status=False)
+        self._batch_output_valid = True
         self.open_batch_output_btn.config(state=tk.NORMAL)
-        messagebox.showinfo("完成", f"批量处理完成!\n成功: {success_count}/{total_files}")
+        color = self.colors['success'] if success_count == total_files else self.colors['danger']
+        self._flash_status(f"✓ 批量处理完成: 成功 {success_count}/{total_files}", color)
         
     def _on_batch_error(self, error_msg):
         """批量处理错误回调"""
+        self._flush_batch_ui(show_status=False)
         self.status_var.set("批量处理失败")
         messagebox.showerror("错误", f"批量处理时发生错误: {error_msg}")
         
     def open_output_file(self):
         """打开输出文件"""
-        if hasattr(self, 'last_output_file') and os.path.exists(self.last_output_file):
-            os.startfile(self.last_output_file)
+        if self._last_output_valid:
+            # Shell关联程序解析可能较慢，在后台线程中打开；文件已被删除等错误在主线程中提示
+            self._run_async(os.startfile, self.last_output_file,
+                            on_err=lambda msg: messagebox.showerror("错误", f"打开输出文件失败: {msg}"))
         
     def open_batch_output(self):
         """打开批量输出目录"""
-        if hasattr(self, 'batch_output_dir') and os.path.exists(self.batch_output_dir):
-            os.startfile(self.batch_output_dir)
+        if self._batch_output_valid:
+            # 直接启动资源管理器进程，不等待Shell枚举目录内容
+            subprocess.Popen(['explorer', os.path.normpath(self.batch_output_dir)])
             
     def _apply_settings_to_config(self):
         """应用界面设置到配置对象"""
+        # 设置标签页尚未创建或界面设置未修改时，配置对象已与界面一致
+        if not self._settings_dirty:
+            return
         self.config.text_width = self.width_var.get()
         self.config.text_indent = self.indent_var.get()
         self.config.base_column_width = self.col_width_var.get()
+        self.config.max_workers = self.max_workers_var.get()
+        self._settings_dirty = False
+        
+    def _mark_settings_dirty(self, *_args) -> None:
+        """界面设置变量的写入回调"""
+        self._settings_dirty = True
+        
+    def _run_async(self, fn: Callable, *args, on_done: Optional[Callable] = None,
+                   on_err: Optional[Callable[[str], None]] = None) -> None:
+        """在后台守护线程中执行可能阻塞的函数，结果与错误通过root.after交回主线程处理
+        
+        界面中所有后台执行（文件处理、配置读写、打开输出文件）都经由此方法，守护线程不会阻止窗口关闭后进程退出。
+        
+        Args:
+            fn: 要执行的函数（不可访问Tk组件）
+            *args: 函数参数
+            on_done: 成功回调，参数为fn的返回值；为空时不回调
+            on_err: 失败回调，参数为错误信息；为空时弹出错误对话框
+        """
+        def worker():
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self.root.after(0, on_err or partial(messagebox.showerror, "错误"), str(e))
+            else:
+                if on_done is not None:
+                    self.root.after(0, on_done, result)
+        
+        threading.Thread(target=worker, daemon=True).start()
         
     def save_config(self):
-        """保存配置"""
+        """保存配置（文件写入在后台线程中进行）"""
         try:
             self._apply_settings_to_config()
             config_path = filedialog.asksaveasfilename(
                 title="保存配置文件",
-                defaultextension=".yaml",
-                filetypes=[
-                    ("YAML文件", "*.yaml"), 
-                    ("YAML文件", "*.yml"),
-                    ("JSON文件", "*.json"), 
-                    ("所有文件", "*.*")
-                ]
+                defaultextension=".json",
+                filetypes=self._CFG_FILETYPES
             )
             if config_path:
-                self.config.save_to_file(config_path)
-                messagebox.showinfo("成功", "配置已保存")
+                self._run_async(self.config.save_to_file, config_path,
+                                on_done=lambda _: messagebox.showinfo("成功", "配置已保存"),
+                                on_err=lambda msg: messagebox.showerror("错误", f"保存配置失败: {msg}"))
         except Exception as e:
             messagebox.showerror("错误", f"保存配置失败: {str(e)}")
             
     def load_config(self):
-        """加载配置"""
+        """加载配置（文件读取与解析在后台线程中进行）"""
         try:
             config_path = filedialog.askopenfilename(
                 title="加载配置文件",
-                filetypes=[
-                    ("YAML文件", "*.yaml"), 
-                    ("YAML文件", "*.yml"),
-                    ("JSON文件", "*.json"), 
-                    ("所有文件", "*.*")
-                ]
+                filetypes=self._CFG_FILETYPES
             )
             if config_path:
-                self.config.load_from_file(config_path)
-                self._update_ui_from_config()
-                messagebox.showinfo("成功", "配置已加载")
+                self._run_async(self.config.load_from_file, config_path,
+                                on_done=self._on_config_loaded,
+                                on_err=lambda msg: messagebox.showerror("错误", f"加载配置失败: {msg}"))
         except Exception as e:
             messagebox.showerror("错误", f"加载配置失败: {str(e)}")
             
+    def _on_config_loaded(self, _result):
+        """配置加载完成回调"""
+        self._update_ui_from_config()
+        messagebox.showinfo("成功", "配置已加载")
+            
     def reset_config(self):
         """重置配置为默认值"""
         self.config = Config()
@@ -792,10 +1141,16 @@ class DocumentExtractorGUI:
         self.width_var.set(self.config.text_width)
         self.indent_var.set(self.config.text_indent)
         self.col_width_var.set(self.config.base_column_width)
+        self.max_workers_var.set(self.config.max_workers)
+        self._settings_dirty = False
         
     def run(self) -> None:
         """运行GUI"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if self.log_listener:
+                self.log_listener.stop()
 
 
 def main() -> int:
@@ -6,43 +6,42 @@ DOCX文档提取器主入口
 GUI模式
 """
 
+import multiprocessing
 import os
 import sys
 
-# 添加src目录到Python路径，支持打包后的exe文件
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-
-# 对于PyInstaller打包的exe，需要处理特殊路径
-if hasattr(sys, '_MEIPASS'):
-    # 这是PyInstaller打包后的临时目录
-    bundle_dir = sys._MEIPASS
-    sys.path.insert(0, bundle_dir)
-else:
-    # 开发环境或直接运行Python脚本
-    bundle_dir = current_dir
-
-try:
-    from gui import main as gui_main
-except ImportError as e:
-    print(f"导入模块失败: {e}")
-    print(f"当前工作目录: {os.getcwd()}")
-    print(f"脚本目录: {current_dir}")
-    print(f"Python路径: {sys.path}")
-    if hasattr(sys, '_MEIPASS'):
-        print(f"PyInstaller临时目录: {sys._MEIPASS}")
-    sys.exit(1)
+# 添加src目录到Python路径，支持打包后的exe文件（Python 3.9起脚本的__file__已是绝对路径）
+current_dir = os.path.dirname(__file__)
 
+# 对于PyInstaller打包的exe，PyInstaller打包后的临时目录优先；开发环境下与src目录相同
+bundle_dir = getattr(sys, '_MEIPASS', current_dir)
+
+# 只修改一次sys.path，已存在的目录不重复添加
+sys.path[:0] = [path for path in dict.fromkeys((bundle_dir, current_dir)) if path not in sys.path]
 
 def main() -> int:
     """主函数，启动GUI界面
     
+    GUI模块在此处才导入：批量处理的子进程（Windows下以spawn方式启动）会重新导入本模块，
+    顶层导入会让每个子进程都加载tkinter和整个界面模块。
+    
     Returns:
         退出码，0表示成功，非0表示失败
     """
+    try:
+        from gui import main as gui_main
+    except ImportError as e:
+        print(f"导入模块失败: {e}")
+        print(f"当前工作目录: {os.getcwd()}")
+        print(f"脚本目录: {current_dir}")
+        print(f"Python路径: {sys.path}")
+        if bundle_dir != current_dir:
+            print(f"PyInstaller临时目录: {bundle_dir}")
+        return 1
     return gui_main()
 
 
 if __name__ == '__main__':
+    # 打包为exe后，批量处理的子进程需要由此接管启动流程
+    multiprocessing.freeze_support()
     sys.exit(main())